@@ -1,7 +1,8 @@
 """MA gateway agent package."""
 from __future__ import annotations
 
-from typing import Any, Iterable, TYPE_CHECKING
+from importlib import import_module
+from typing import Any, Dict, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .config import AgentConfig
@@ -10,22 +11,23 @@ if TYPE_CHECKING:
 
 __all__ = ["AgentConfig", "GatewayService", "read_version"]
 
+# Public name -> submodule providing it, imported on first access.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "AgentConfig": ".config",
+    "GatewayService": ".gateway",
+    "read_version": ".versioning",
+}
 
-def __getattr__(name: str) -> Any:  # pragma: no cover - simple import proxy
-    if name == "AgentConfig":
-        from .config import AgentConfig  # local import for lazy loading
-
-        return AgentConfig
-    if name == "GatewayService":
-        from .gateway import GatewayService  # local import for lazy loading
 
-        return GatewayService
-    if name == "read_version":
-        from .versioning import read_version  # local import for lazy loading
-
-        return read_version
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def __getattr__(name: str) -> Any:  # pragma: no cover - simple import proxy
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Bind the attribute so later lookups no longer reach this hook.
+    globals()[name] = value
+    return value
 
 
 def __dir__() -> Iterable[str]:  # pragma: no cover - introspection helper
-    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import signal
 import threading
-import time
 
 from .config import AgentConfig
 from .gateway import GatewayService
@@ -32,29 +31,26 @@ def main() -> None:
             route_format=config.simulator_route_format,
         )
 
-    service = GatewayService(config, telemetry_publisher=telemetry_publisher)
-    service.start()
-
     # Mantém a thread principal viva enquanto os transports rodam em background.
     stop_event = threading.Event()
 
     def _handle_signal(signum, frame):  # pragma: no cover - signal handling
         stop_event.set()
 
-    # registra os sinais FORA do handler
+    # Registra os sinais antes de iniciar os transports para que um SIGTERM
+    # recebido durante a inicialização também encerre o serviço de forma limpa.
     signal.signal(signal.SIGTERM, _handle_signal)
     signal.signal(signal.SIGINT, _handle_signal)
 
+    service = GatewayService(config, telemetry_publisher=telemetry_publisher)
     try:
-        while not stop_event.is_set():
-            time.sleep(1)
+        service.start()
+        # Bloqueia sem despertar periodicamente; o handler de sinal libera o evento.
+        stop_event.wait()
     except KeyboardInterrupt:  # pragma: no cover
         pass
     finally:
-        telemetry_publisher = getattr(service, "telemetry_publisher", None)
-        stop = getattr(telemetry_publisher, "stop", None)
-        if callable(stop):
-            stop()
+        service.stop()
 
 if __name__ == "__main__":  # pragma: no cover
     main()
\ No newline at end of file
@@ -10,18 +10,62 @@ towards the geographic north and rotations increase clockwise.
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass
+import logging
 import math
-from typing import Optional, Tuple
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
 
+try:  # pragma: no cover - optional dependency
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+LOGGER = logging.getLogger(__name__)
+
+# ``slots`` support for ``dataclasses`` was added in Python 3.10.
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+NUMBA_AVAILABLE = njit is not None
+
+_F = TypeVar("_F", bound=Callable[..., object])
+
+if NUMBA_AVAILABLE:
+    # The articulation core and its scalar helpers only touch floats, so
+    # Numba can compile them once (and cache the machine code on disk) when
+    # it is installed.
+    _jit = njit(cache=True)
+else:
+
+    def _jit(func: _F) -> _F:
+        return func
+
+
+# Bound once so the per-step maths uses fast global loads instead of
+# ``math`` attribute lookups.  A fused libm ``sincos`` reached through ctypes
+# is not worth it: the foreign call costs ~1.2 µs against ~0.1 µs for the
+# separate ``sin``/``cos`` pair.
+_sin = math.sin
+_cos = math.cos
+_atan2 = math.atan2
+_hypot = math.hypot
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
 
 EPS_STEP = 0.01  # Minimum displacement (m) to consider a heading update
 EPS_IMPL = 0.01  # Minimum implement displacement (m) considered meaningful
+# Squared thresholds for checks that only compare a length (no sqrt needed).
+_EPS_STEP_SQ = EPS_STEP * EPS_STEP
+_EPS_IMPL_SQ = EPS_IMPL * EPS_IMPL
 
 
-@dataclass(frozen=True)
-class Coordinate:
-    """Simple 2D coordinate expressed in meters (local ENU frame)."""
+class Coordinate(NamedTuple):
+    """Simple 2D coordinate expressed in meters (local ENU frame).
+
+    A :class:`~typing.NamedTuple` keeps construction at tuple speed; several
+    coordinates are allocated for every articulation step.
+    """
 
     x: float
     y: float
@@ -39,10 +83,10 @@ class Coordinate:
     def distance_to(self, other: "Coordinate") -> float:
         """Return the Euclidean distance to ``other`` in meters."""
 
-        return math.hypot(self.x - other.x, self.y - other.y)
+        return _hypot(self.x - other.x, self.y - other.y)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_DATACLASS_KWARGS)
 class ArticulationState:
     """Snapshot describing the articulated implement state."""
 
@@ -54,6 +98,175 @@ class ArticulationState:
     significant_motion: bool
 
 
+class ArticulationGeometry(NamedTuple):
+    """Constants derived from the implement geometry.
+
+    They only change with the implement configuration, so streaming callers
+    build them once (see :meth:`from_offsets`) and pass them to
+    :func:`compute_articulated_centers_from_geometry` on every step.
+    """
+
+    long_offset: float
+    offset_lateral: float
+    hitch_length: float
+    implement_length: float
+    alpha: float
+    damping_scale: float
+    relax_scale: float
+
+    @classmethod
+    def from_offsets(
+        cls,
+        *,
+        distancia_antena: float,
+        offset_longitudinal: float,
+        offset_lateral: float,
+        work_width_m: float,
+        articulation_to_tool_m: Optional[float] = None,
+    ) -> "ArticulationGeometry":
+        long_offset = distancia_antena + offset_longitudinal
+        Lhitch = max(long_offset, 0.1)
+        if articulation_to_tool_m is not None:
+            Limpl = max(float(articulation_to_tool_m), 0.0)
+        else:
+            Limpl = max(0.5 * work_width_m, 1.0)
+        return cls(
+            long_offset=long_offset,
+            offset_lateral=offset_lateral,
+            hitch_length=Lhitch,
+            implement_length=Limpl,
+            alpha=_clamp(Lhitch / (Lhitch + Limpl), 0.3, 0.9),
+            damping_scale=max(Lhitch, 0.1),
+            relax_scale=max(Limpl, 0.1),
+        )
+
+
+class ArticulationTrack:
+    """Ring buffer of recent :class:`ArticulationState` samples stored by column.
+
+    Each field is kept in a flat ``array('d')`` (``array('b')`` for the motion
+    flag) instead of one object per sample, so long histories stay compact
+    and per-field scans walk contiguous memory.  Once ``capacity`` samples
+    are stored the oldest ones are overwritten.
+    """
+
+    FIELDS = (
+        "last_x",
+        "last_y",
+        "cur_x",
+        "cur_y",
+        "joint_x",
+        "joint_y",
+        "axis_x",
+        "axis_y",
+        "theta",
+    )
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._columns = [array("d", bytes(8 * capacity)) for _ in self.FIELDS]
+        self._significant = array("b", bytes(capacity))
+        self._next = 0  # slot written by the next append
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, state: ArticulationState) -> None:
+        self.append_values(
+            *state.last_center,
+            *state.current_center,
+            *state.articulation_point,
+            *state.axis,
+            state.theta,
+            state.significant_motion,
+        )
+
+    def append_values(
+        self,
+        last_x: float,
+        last_y: float,
+        cur_x: float,
+        cur_y: float,
+        joint_x: float,
+        joint_y: float,
+        axis_x: float,
+        axis_y: float,
+        theta: float,
+        significant_motion: bool,
+    ) -> None:
+        """Append one sample given as plain floats (``FIELDS`` order)."""
+
+        index = self._next
+        columns = self._columns
+        columns[0][index] = last_x
+        columns[1][index] = last_y
+        columns[2][index] = cur_x
+        columns[3][index] = cur_y
+        columns[4][index] = joint_x
+        columns[5][index] = joint_y
+        columns[6][index] = axis_x
+        columns[7][index] = axis_y
+        columns[8][index] = theta
+        self._significant[index] = significant_motion
+        self._next = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, states: Iterable[ArticulationState]) -> None:
+        for state in states:
+            self.append(state)
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    def columns(self) -> Dict[str, array]:
+        """Return every field as an array ordered from oldest to newest."""
+
+        result = {
+            name: self._ordered(column) for name, column in zip(self.FIELDS, self._columns)
+        }
+        result["significant_motion"] = self._ordered(self._significant)
+        return result
+
+    def state(self, index: int) -> ArticulationState:
+        """Rebuild the ``index``-th sample (oldest first, negatives allowed)."""
+
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("articulation track index out of range")
+        slot = (self._next - self._size + index) % self.capacity
+        (
+            last_x,
+            last_y,
+            cur_x,
+            cur_y,
+            joint_x,
+            joint_y,
+            axis_x,
+            axis_y,
+            theta,
+        ) = self._columns
+        return ArticulationState(
+            last_center=Coordinate(last_x[slot], last_y[slot]),
+            current_center=Coordinate(cur_x[slot], cur_y[slot]),
+            articulation_point=Coordinate(joint_x[slot], joint_y[slot]),
+            axis=(axis_x[slot], axis_y[slot]),
+            theta=theta[slot],
+            significant_motion=bool(self._significant[slot]),
+        )
+
+    def _ordered(self, column: array) -> array:
+        start = self._next - self._size
+        if start >= 0:
+            return column[start:self._next]
+        return column[start:] + column[: self._next]
+
+
 def compute_articulated_centers(
     last_xy: Coordinate,
     cur_xy: Coordinate,
@@ -70,6 +283,7 @@ def compute_articulated_centers(
     previous_displacement: Optional[Tuple[float, float]] = None,
     last_fwd: Optional[Tuple[float, float]] = None,
     last_right: Optional[Tuple[float, float]] = None,
+    last_axis: Optional[Tuple[float, float]] = None,
 ) -> ArticulationState:
     """Compute articulated implement centres matching the monitor model.
 
@@ -104,155 +318,456 @@ def compute_articulated_centers(
         Optional forward/right vectors associated with ``last_xy``. When
         unavailable the current orientation is used as a reasonable
         approximation.
+    last_axis:
+        Optional ``axis`` of the previous :class:`ArticulationState`, i.e. the
+        one whose ``theta`` is passed as ``impl_theta_rad``. It encodes that
+        heading's direction, so its sine and cosine are not evaluated again.
     """
-    """print(
-        "\n[compute_articulated_centers] CHAMADA",
-        f"\n last_xy = {last_xy}",
-        f"\n cur_xy = {cur_xy}",
-        f"\n fwd = {fwd}",
-        f"\n right = {right}",
-        f"\n distancia_antena = {distancia_antena}",
-        f"\n offset_longitudinal = {offset_longitudinal}",
-        f"\n offset_lateral = {offset_lateral}",
-        f"\n work_width_m = {work_width_m}",
-        f"\n articulation_to_tool_m = {articulation_to_tool_m}",
-        f"\n impl_theta_rad = {impl_theta_rad}",
-        f"\n tractor_heading_rad = {tractor_heading_rad}",
-        f"\n previous_displacement = {previous_displacement}",
-        f"\n last_fwd = {last_fwd}",
-        f"\n last_right = {last_right}",
-        "\n---------------------------------------------"
-    )"""
-
-    long_offset = distancia_antena + offset_longitudinal
-    Lhitch = max(long_offset, 0.1)
-    if articulation_to_tool_m is not None:
-        Limpl = max(float(articulation_to_tool_m), 0.0)
-    else:
-        Limpl = max(0.5 * work_width_m, 1.0)
 
+    geometry = ArticulationGeometry.from_offsets(
+        distancia_antena=distancia_antena,
+        offset_longitudinal=offset_longitudinal,
+        offset_lateral=offset_lateral,
+        work_width_m=work_width_m,
+        articulation_to_tool_m=articulation_to_tool_m,
+    )
+    return compute_articulated_centers_from_geometry(
+        last_xy,
+        cur_xy,
+        geometry,
+        fwd=fwd,
+        right=right,
+        impl_theta_rad=impl_theta_rad,
+        tractor_heading_rad=tractor_heading_rad,
+        previous_displacement=previous_displacement,
+        last_fwd=last_fwd,
+        last_right=last_right,
+        last_axis=last_axis,
+    )
 
-    # 1) Articulation point for the current step
-    Jx = cur_xy.x - long_offset * fwd[0] + offset_lateral * right[0]
-    Jy = cur_xy.y - long_offset * fwd[1] + offset_lateral * right[1]
+
+def compute_articulated_centers_from_geometry(
+    last_xy: Coordinate,
+    cur_xy: Coordinate,
+    geometry: ArticulationGeometry,
+    *,
+    fwd: Tuple[float, float],
+    right: Tuple[float, float],
+    impl_theta_rad: Optional[float],
+    tractor_heading_rad: Optional[float] = None,
+    previous_displacement: Optional[Tuple[float, float]] = None,
+    last_fwd: Optional[Tuple[float, float]] = None,
+    last_right: Optional[Tuple[float, float]] = None,
+    last_axis: Optional[Tuple[float, float]] = None,
+) -> ArticulationState:
+    """Variant of :func:`compute_articulated_centers` taking precomputed geometry."""
+
+    if last_fwd is None:
+        last_fwd = fwd
+    if last_right is None:
+        last_right = right
+    # ``None`` inputs are passed as flags so the numeric core only sees floats.
+    (
+        Jx,
+        Jy,
+        cur_x,
+        cur_y,
+        last_x,
+        last_y,
+        to_tool_x,
+        to_tool_y,
+        theta_i,
+        significant_motion,
+        dist,
+        th_trac,
+        kappa,
+    ) = _articulation_core(
+        last_xy[0],
+        last_xy[1],
+        cur_xy[0],
+        cur_xy[1],
+        fwd[0],
+        fwd[1],
+        right[0],
+        right[1],
+        last_fwd[0],
+        last_fwd[1],
+        last_right[0],
+        last_right[1],
+        geometry.long_offset,
+        geometry.offset_lateral,
+        geometry.implement_length,
+        geometry.alpha,
+        geometry.damping_scale,
+        geometry.relax_scale,
+        impl_theta_rad if impl_theta_rad is not None else 0.0,
+        impl_theta_rad is not None,
+        tractor_heading_rad if tractor_heading_rad is not None else 0.0,
+        tractor_heading_rad is not None,
+        previous_displacement[0] if previous_displacement is not None else 0.0,
+        previous_displacement[1] if previous_displacement is not None else 0.0,
+        previous_displacement is not None,
+        # axis = (-to_tool_y, to_tool_x), see below.
+        last_axis[1] if last_axis is not None else 0.0,
+        -last_axis[0] if last_axis is not None else 0.0,
+        last_axis is not None,
+    )
     articulation_point = Coordinate(Jx, Jy)
+    cur_impl = Coordinate(cur_x, cur_y)
+    last_impl = Coordinate(last_x, last_y)
+    # Perpendicular vector describing the implement width bar. Rotating the
+    # articulation-to-tool vector by +90° yields a consistent "T" layout.
+    axis = (-to_tool_y, to_tool_x)
+
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(
+            "articulation: dist=%.4f th_trac=%.4f kappa=%.6f theta=%.4f "
+            "center=(%.3f, %.3f) significant_motion=%s",
+            dist,
+            th_trac,
+            kappa,
+            theta_i,
+            cur_x,
+            cur_y,
+            significant_motion,
+        )
+
+    return ArticulationState(
+        last_center=last_impl,
+        current_center=cur_impl,
+        articulation_point=articulation_point,
+        axis=axis,
+        theta=theta_i,
+        significant_motion=significant_motion,
+    )
+
+
+def compute_rigid_center(
+    cur_xy: Coordinate,
+    *,
+    fwd: Tuple[float, float],
+    right: Tuple[float, float],
+    long_offset: float,
+    offset_lateral: float,
+) -> Coordinate:
+    """Return the implement centre of a rigidly mounted (non-articulated) tool.
+
+    Without a joint there is no heading lag or curvature to track: the tool
+    centre is the antenna position shifted by the fixed offsets along the
+    tractor axes, i.e. the articulation point of the articulated model.
+    """
+
+    return Coordinate(
+        cur_xy.x - long_offset * fwd[0] + offset_lateral * right[0],
+        cur_xy.y - long_offset * fwd[1] + offset_lateral * right[1],
+    )
+
+
+# Articulation point, current/previous implement centres, articulation-to-tool
+# direction, implement heading, motion flag, then dist/th_trac/kappa.
+_CoreResult = Tuple[
+    float, float, float, float, float, float, float, float, float, bool, float, float, float
+]
+
+
+@_jit
+def _articulation_core(
+    lx: float,
+    ly: float,
+    cx: float,
+    cy: float,
+    fx: float,
+    fy: float,
+    rx: float,
+    ry: float,
+    lfx: float,
+    lfy: float,
+    lrx: float,
+    lry: float,
+    long_offset: float,
+    offset_lateral: float,
+    Limpl: float,
+    alpha: float,
+    damping_scale: float,
+    relax_scale: float,
+    impl_theta: float,
+    has_impl_theta: bool,
+    tractor_heading: float,
+    has_tractor_heading: bool,
+    prev_dx: float,
+    prev_dy: float,
+    has_prev_displacement: bool,
+    prev_tx: float,
+    prev_ty: float,
+    has_prev_to_tool: bool,
+) -> _CoreResult:
+    """Scalar core of :func:`compute_articulated_centers`.
+
+    Only floats and flags go in and out so the function can be compiled by
+    Numba when it is installed.  Returns the articulation point, current and
+    previous implement centres, the articulation-to-tool direction, the
+    implement heading, the motion flag and the ``dist``/``th_trac``/``kappa``
+    intermediates used for logging.
+    """
+
+    # 1) Articulation point for the current step
+    Jx = cx - long_offset * fx + offset_lateral * rx
+    Jy = cy - long_offset * fy + offset_lateral * ry
 
     # 2) Tractor heading estimation
-    displacement = cur_xy.delta(last_xy)
-    dist = math.hypot(*displacement)
-    if dist >= EPS_STEP:
-        th_trac = math.atan2(displacement[0], displacement[1])
-    elif tractor_heading_rad is not None:
-        th_trac = tractor_heading_rad
-    elif impl_theta_rad is not None:
-        th_trac = impl_theta_rad
+    dx = cx - lx
+    dy = cy - ly
+    dist = _hypot(dx, dy)
+    moving = dist >= EPS_STEP
+    if moving:
+        th_trac = _atan2(dx, dy)
+    elif has_tractor_heading:
+        th_trac = tractor_heading
+    elif has_impl_theta:
+        th_trac = impl_theta
     else:
         th_trac = 0.0  # default to facing north
 
     # 2b) Estimate curvature from the change in displacement vectors
-    if previous_displacement is not None and dist >= EPS_STEP:
-        prev_dx, prev_dy = previous_displacement
-        prev_dist = math.hypot(prev_dx, prev_dy)
-        if prev_dist >= EPS_STEP:
-            prev_heading = math.atan2(prev_dx, prev_dy)
-            dpsi = _wrap_angle(math.atan2(displacement[0], displacement[1]) - prev_heading)
+    kappa = 0.0
+    if has_prev_displacement and moving:
+        if prev_dx * prev_dx + prev_dy * prev_dy >= _EPS_STEP_SQ:
+            prev_heading = _atan2(prev_dx, prev_dy)
+            # ``th_trac`` is the displacement heading on this branch.
+            dpsi = _wrap_angle_core(th_trac - prev_heading)
             kappa = dpsi / max(dist, 1e-6)
-        else:
-            kappa = 0.0
-    else:
-        kappa = 0.0
 
     # 2c) Update implement heading with a simple lag model
-    if impl_theta_rad is None:
+    if not has_impl_theta:
         theta_i = th_trac
     else:
-        alpha = _clamp(Lhitch / (Lhitch + Limpl), 0.3, 0.9)
-        theta_i = _wrap_angle(impl_theta_rad + alpha * kappa * dist)
-        heading_error = _wrap_angle(th_trac - theta_i)
+        theta_i = _wrap_angle_core(impl_theta + alpha * kappa * dist)
+        heading_error = _wrap_angle_core(th_trac - theta_i)
         # Dampen the alignment term while the tractor is cornering so the
         # implement does not instantly snap to the new heading. Sharp turns
         # (high curvature) produce a smaller relaxation factor, while straight
         # segments still converge normally.
-        turn_damping = 1.0 / (1.0 + abs(kappa) * max(Lhitch, 0.1))
-        relax_rate = _clamp(dist / max(Limpl, 0.1), 0.0, 1.0) * turn_damping
-        theta_i = _wrap_angle(theta_i + (1.0 - alpha) * heading_error * relax_rate)
+        turn_damping = 1.0 / (1.0 + abs(kappa) * damping_scale)
+        relax_rate = _clamp_core(dist / relax_scale, 0.0, 1.0) * turn_damping
+        theta_i = _wrap_angle_core(theta_i + (1.0 - alpha) * heading_error * relax_rate)
 
     # 3) Implement axis and centres
     # articulation point relative to the heading. The line from the hitch to
     # the tool should intersect the implement bar at a right angle (a "T"
     # shape). Use the negative heading vectors to ensure the implement is
-    # positioned behind the hitch instead of in front of the tractor and a
-    # perpendicular axis to represent the bar width.
-    to_tool_x = -math.sin(theta_i)
-    to_tool_y = -math.cos(theta_i)
-    to_tool_norm = math.hypot(to_tool_x, to_tool_y) or 1.0
-    to_tool = (to_tool_x / to_tool_norm, to_tool_y / to_tool_norm)
-
-    cur_impl = articulation_point.translate(Limpl * to_tool[0], Limpl * to_tool[1])
-
-    # Perpendicular vector describing the implement width bar. Rotating the
-    # articulation-to-tool vector by +90° yields a consistent "T" layout.
-    axis = (-to_tool[1], to_tool[0])
+    # positioned behind the hitch instead of in front of the tractor.
+    # (-sin, -cos) is already a unit vector, so no normalisation is needed.
+    tx = -_sin(theta_i)
+    ty = -_cos(theta_i)
+    cur_x = Jx + Limpl * tx
+    cur_y = Jy + Limpl * ty
 
     # Previous articulation point (best effort when orientation data missing)
-    fwd_prev = last_fwd if last_fwd is not None else fwd
-    right_prev = last_right if last_right is not None else right
-    Jlx = last_xy.x - long_offset * fwd_prev[0] + offset_lateral * right_prev[0]
-    Jly = last_xy.y - long_offset * fwd_prev[1] + offset_lateral * right_prev[1]
-    axis_prev = impl_theta_rad
-    if axis_prev is None:
-        last_to_tool = to_tool
+    Jlx = lx - long_offset * lfx + offset_lateral * lrx
+    Jly = ly - long_offset * lfy + offset_lateral * lry
+    if has_impl_theta:
+        if has_prev_to_tool:
+            ltx = prev_tx
+            lty = prev_ty
+        else:
+            ltx = -_sin(impl_theta)
+            lty = -_cos(impl_theta)
     else:
-        last_to_tool = (
-            -math.sin(axis_prev),
-            -math.cos(axis_prev),
-        )
-        norm = math.hypot(*last_to_tool) or 1.0
-        last_to_tool = (last_to_tool[0] / norm, last_to_tool[1] / norm)
-    last_impl = Coordinate(Jlx + Limpl * last_to_tool[0], Jly + Limpl * last_to_tool[1])
-
-    significant_motion = cur_impl.distance_to(last_impl) >= EPS_IMPL
-
-    print(
-        "\n[ARTICULATION DEBUG]",
-        f"\n  Tractor:",
-        f"\n    last_xy = {last_xy}",
-        f"\n    cur_xy = {cur_xy}",
-        f"\n    displacement = {displacement}",
-        f"\n    dist = {dist:.4f} m",
-        f"\n    tractor_heading (rad) = {th_trac:.4f}",
-        f"\n",
-        f"\n  Curvature:",
-        f"\n    previous_displacement = {previous_displacement}",
-        f"\n    kappa = {kappa:.6f} rad/m",
-        f"\n",
-        f"\n  Implement:",
-        f"\n    impl_theta (rad) = {theta_i:.4f}",
-        f"\n    impl_theta (deg) = {math.degrees(theta_i):.2f}°",
-        f"\n    axis = {axis}",
-        f"\n    articulation_point = {articulation_point}",
-        f"\n    last_center = {last_impl}",
-        f"\n    current_center = {cur_impl}",
-        f"\n    movement = {cur_impl.distance_to(last_impl):.4f} m",
-        f"\n    significant_motion = {significant_motion}",
-        "\n---------------------------------------------"
+        ltx = tx
+        lty = ty
+    last_x = Jlx + Limpl * ltx
+    last_y = Jly + Limpl * lty
+
+    move_x = cur_x - last_x
+    move_y = cur_y - last_y
+    significant_motion = move_x * move_x + move_y * move_y >= _EPS_IMPL_SQ
+    return (
+        Jx,
+        Jy,
+        cur_x,
+        cur_y,
+        last_x,
+        last_y,
+        tx,
+        ty,
+        theta_i,
+        significant_motion,
+        dist,
+        th_trac,
+        kappa,
     )
 
 
-    return ArticulationState(
-        last_center=last_impl,
-        current_center=cur_impl,
-        articulation_point=articulation_point,
-        axis=axis,
-        theta=theta_i,
-        significant_motion=significant_motion,
+def compute_articulated_track(
+    positions: Iterable[Tuple[float, float]],
+    headings_rad: Iterable[float],
+    *,
+    distancia_antena: float,
+    offset_longitudinal: float,
+    offset_lateral: float,
+    work_width_m: float,
+    articulation_to_tool_m: Optional[float] = None,
+    impl_theta_rad: Optional[float] = None,
+) -> List[ArticulationState]:
+    """Replay :func:`compute_articulated_centers` over a whole trajectory.
+
+    ``positions`` holds the antenna ``(x, y)`` samples in meters and
+    ``headings_rad`` the matching tractor headings.  The result matches
+    calling :func:`compute_articulated_centers` step by step with the
+    forward/right vectors, previous displacement and implement heading
+    threaded through, but the loop is specialised for replays: the geometry
+    constants are computed once and the previous step's articulation point
+    and displacement heading are reused instead of being recomputed.
+    """
+
+    geometry = ArticulationGeometry.from_offsets(
+        distancia_antena=distancia_antena,
+        offset_longitudinal=offset_longitudinal,
+        offset_lateral=offset_lateral,
+        work_width_m=work_width_m,
+        articulation_to_tool_m=articulation_to_tool_m,
     )
+    return [
+        ArticulationState(
+            last_center=Coordinate(last_x, last_y),
+            current_center=Coordinate(cur_x, cur_y),
+            articulation_point=Coordinate(joint_x, joint_y),
+            axis=(axis_x, axis_y),
+            theta=theta,
+            significant_motion=significant_motion,
+        )
+        for (
+            last_x,
+            last_y,
+            cur_x,
+            cur_y,
+            joint_x,
+            joint_y,
+            axis_x,
+            axis_y,
+            theta,
+            significant_motion,
+        ) in _track_rows(positions, headings_rad, geometry, impl_theta_rad)
+    ]
+
+
+def fill_articulation_track(
+    track: ArticulationTrack,
+    positions: Iterable[Tuple[float, float]],
+    headings_rad: Iterable[float],
+    geometry: ArticulationGeometry,
+    *,
+    impl_theta_rad: Optional[float] = None,
+) -> ArticulationTrack:
+    """Replay a trajectory straight into the columns of ``track``.
+
+    Same computation as :func:`compute_articulated_track`, but the floats go
+    directly into the track's arrays: no :class:`Coordinate` or
+    :class:`ArticulationState` is allocated per sample.
+    """
+
+    append = track.append_values
+    for row in _track_rows(positions, headings_rad, geometry, impl_theta_rad):
+        append(*row)
+    return track
+
+
+_TrackRow = Tuple[float, float, float, float, float, float, float, float, float, bool]
+
+
+def _track_rows(
+    positions: Iterable[Tuple[float, float]],
+    headings_rad: Iterable[float],
+    geometry: ArticulationGeometry,
+    impl_theta_rad: Optional[float],
+) -> Iterator[_TrackRow]:
+    """Yield one row per sample in :attr:`ArticulationTrack.FIELDS` order."""
+
+    # Everything that only depends on the implement geometry is hoisted out
+    # of the loop; only the implement heading lag is a true recurrence.
+    long_offset, offset_lateral, _, Limpl, alpha, damping_scale, relax_scale = geometry
+    theta = impl_theta_rad
+    last_x = last_y = 0.0
+    last_Jx = last_Jy = 0.0
+    last_heading: Optional[float] = None  # heading of the previous displacement
+    last_to_tool: Optional[Tuple[float, float]] = None
+    first = True
+    for (x, y), heading in zip(positions, headings_rad):
+        fx = _sin(heading)
+        fy = _cos(heading)
+        Jx = x - long_offset * fx + offset_lateral * fy
+        Jy = y - long_offset * fy + offset_lateral * -fx
+        if first:
+            last_x, last_y, last_Jx, last_Jy = x, y, Jx, Jy
+            first = False
+
+        dx = x - last_x
+        dy = y - last_y
+        dist = _hypot(dx, dy)
+        if dist >= EPS_STEP:
+            step_heading: Optional[float] = _atan2(dx, dy)
+            th_trac = step_heading
+            if last_heading is not None:
+                kappa = _wrap_angle(step_heading - last_heading) / max(dist, 1e-6)
+            else:
+                kappa = 0.0
+        else:
+            step_heading = None
+            th_trac = heading
+            kappa = 0.0
+
+        if theta is None:
+            theta_i = th_trac
+        else:
+            theta_i = _wrap_angle(theta + alpha * kappa * dist)
+            heading_error = _wrap_angle(th_trac - theta_i)
+            turn_damping = 1.0 / (1.0 + abs(kappa) * damping_scale)
+            relax_rate = _clamp(dist / relax_scale, 0.0, 1.0) * turn_damping
+            theta_i = _wrap_angle(theta_i + (1.0 - alpha) * heading_error * relax_rate)
+
+        tx = -_sin(theta_i)
+        ty = -_cos(theta_i)
+        if theta is None:
+            ltx, lty = tx, ty
+        elif last_to_tool is not None:
+            # ``theta`` is the previous step's heading: reuse its direction
+            # instead of evaluating sin/cos for it a second time.
+            ltx, lty = last_to_tool
+        else:
+            ltx = -_sin(theta)
+            lty = -_cos(theta)
+        cur_x = Jx + Limpl * tx
+        cur_y = Jy + Limpl * ty
+        prev_x = last_Jx + Limpl * ltx
+        prev_y = last_Jy + Limpl * lty
+        move_x = cur_x - prev_x
+        move_y = cur_y - prev_y
+        yield (
+            prev_x,
+            prev_y,
+            cur_x,
+            cur_y,
+            Jx,
+            Jy,
+            -ty,
+            tx,
+            theta_i,
+            move_x * move_x + move_y * move_y >= _EPS_IMPL_SQ,
+        )
+
+        theta = theta_i
+        last_to_tool = (tx, ty)
+        last_heading = step_heading
+        last_x, last_y, last_Jx, last_Jy = x, y, Jx, Jy
 
 
 def _wrap_angle(angle: float) -> float:
     """Wrap an angle to the ``[-pi, pi)`` interval."""
 
-    return (angle + math.pi) % (2.0 * math.pi) - math.pi
+    # Most inputs (small heading increments) are already in range.
+    if -_PI <= angle < _PI:
+        return angle
+    return (angle + _PI) % _TWO_PI - _PI
 
 
 def _clamp(value: float, minimum: float, maximum: float) -> float:
@@ -265,10 +780,24 @@ def _clamp(value: float, minimum: float, maximum: float) -> float:
     return value
 
 
+# Compiled copies for ``_articulation_core``.  Python callers keep the plain
+# functions: calling a Numba dispatcher once per sample from Python costs more
+# than the arithmetic it saves.
+_wrap_angle_core = _jit(_wrap_angle)
+_clamp_core = _jit(_clamp)
+
+
 __all__ = [
+    "ArticulationGeometry",
     "ArticulationState",
+    "ArticulationTrack",
     "Coordinate",
     "EPS_IMPL",
     "EPS_STEP",
+    "NUMBA_AVAILABLE",
     "compute_articulated_centers",
+    "compute_articulated_centers_from_geometry",
+    "compute_articulated_track",
+    "compute_rigid_center",
+    "fill_articulation_track",
 ]
\ No newline at end of file
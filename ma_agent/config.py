@@ -5,18 +5,24 @@ import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Tuple
 
 
 # ``slots`` support for ``dataclasses`` was added in Python 3.10. Keep using
-# slots where available, but remain compatible with Python 3.9.
-_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# slots where available, but remain compatible with Python 3.9.  The config is
+# frozen so the instance built at startup can be shared by every component.
+_DATACLASS_KWARGS = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
 
 
 @dataclass(**_DATACLASS_KWARGS)
 class AgentConfig:
     tcp_host: str = "0.0.0.0"
     tcp_port: int = 7777
+    tcp_backlog: int = 128
+    tcp_recv_buffer_bytes: int = 1 << 20
+    tcp_send_buffer_bytes: int = 1 << 20
     enable_bluetooth: bool = True
     bluetooth_channel: int = 1
     service_name: str = "MAGateway"
@@ -36,44 +42,70 @@ class AgentConfig:
 
     @classmethod
     def from_env(cls) -> "AgentConfig":
-        return cls(
-            tcp_host=os.environ.get("MA_AGENT_TCP_HOST", "0.0.0.0"),
-            tcp_port=int(os.environ.get("MA_AGENT_TCP_PORT", "7777")),
-            enable_bluetooth=os.environ.get("MA_AGENT_ENABLE_BT", "1") not in {"0", "false", "False"},
-            bluetooth_channel=int(os.environ.get("MA_AGENT_BT_CHANNEL", "1")),
-            service_name=os.environ.get("MA_AGENT_SERVICE_NAME", "MAGateway"),
-            service_uuid=os.environ.get("MA_AGENT_BT_SERVICE_UUID"),
-            implement_profile_path=os.environ.get(
-                "MA_AGENT_IMPLEMENT_CONFIG",
-                str(Path.cwd() / "config" / "implement.vence_tudo.json"),
-            ),
-            enable_planter_simulator=os.environ.get("MA_AGENT_ENABLE_SIMULATOR", "1")
-                                     not in {"0", "false", "False"},
-            simulator_field_length_m=float(
-                os.environ.get("MA_AGENT_SIM_FIELD_LENGTH_M", "300.0")
-            ),
-            simulator_headland_length_m=float(
-                os.environ.get("MA_AGENT_SIM_HEADLAND_M", "20.0")
-            ),
-            simulator_speed_mps=float(os.environ.get("MA_AGENT_SIM_SPEED_MPS", "2.5")),
-            simulator_sample_rate_hz=float(
-                os.environ.get("MA_AGENT_SIM_SAMPLE_HZ", "5.0")
-            ),
-            simulator_passes_per_cycle=int(
-                os.environ.get("MA_AGENT_SIM_PASSES_PER_CYCLE", "8")
-            ),
-            simulator_base_lat=float(os.environ.get("MA_AGENT_SIM_BASE_LAT", "-22.0")),
-            simulator_base_lon=float(os.environ.get("MA_AGENT_SIM_BASE_LON", "-47.0")),
-            simulator_altitude_m=float(os.environ.get("MA_AGENT_SIM_ALTITUDE_M", "550.0")),
-            simulator_route_file=os.environ.get(
-                "MA_AGENT_SIM_ROUTE_FILE",
-                str(Path.cwd() / "config" / "routes" / "rota_plantio_terracos.geojson"),
-            ),
-            simulator_route_format=os.environ.get(
-                "MA_AGENT_SIM_ROUTE_FORMAT",
-                "geojson",
-            ),
-        )
+        """Build a configuration from the current environment.
+
+        Every call parses the environment again.  ``agent.main`` does it once
+        at startup and hands the result to :class:`~ma_agent.gateway.GatewayService`.
+        """
+
+        environ = os.environ
+        kwargs = {}
+        for name, variable, parse, default in _ENV_FIELDS:
+            raw = environ.get(variable)
+            if raw is None:
+                raw = default() if callable(default) else default
+            kwargs[name] = parse(raw) if raw is not None else None
+        return cls(**kwargs)
+
+
+def _parse_bool(value: str) -> bool:
+    return value not in {"0", "false", "False"}
+
+
+def _parse_str(value: str) -> str:
+    return value
+
+
+def _config_path(*parts: str) -> Callable[[], str]:
+    # Resolved when the environment is parsed, relative to the working directory.
+    return lambda: str(Path.cwd().joinpath("config", *parts))
+
+
+# ``(field, environment variable, parser, default)``. Defaults are raw strings
+# run through the parser, a callable producing one, or ``None``.
+_ENV_FIELDS: Tuple[Tuple[str, str, Callable[[str], Any], Any], ...] = (
+    ("tcp_host", "MA_AGENT_TCP_HOST", _parse_str, "0.0.0.0"),
+    ("tcp_port", "MA_AGENT_TCP_PORT", int, "7777"),
+    ("tcp_backlog", "MA_AGENT_TCP_BACKLOG", int, "128"),
+    ("tcp_recv_buffer_bytes", "MA_AGENT_TCP_RCVBUF", int, str(1 << 20)),
+    ("tcp_send_buffer_bytes", "MA_AGENT_TCP_SNDBUF", int, str(1 << 20)),
+    ("enable_bluetooth", "MA_AGENT_ENABLE_BT", _parse_bool, "1"),
+    ("bluetooth_channel", "MA_AGENT_BT_CHANNEL", int, "1"),
+    ("service_name", "MA_AGENT_SERVICE_NAME", _parse_str, "MAGateway"),
+    ("service_uuid", "MA_AGENT_BT_SERVICE_UUID", _parse_str, None),
+    (
+        "implement_profile_path",
+        "MA_AGENT_IMPLEMENT_CONFIG",
+        _parse_str,
+        _config_path("implement.vence_tudo.json"),
+    ),
+    ("enable_planter_simulator", "MA_AGENT_ENABLE_SIMULATOR", _parse_bool, "1"),
+    ("simulator_field_length_m", "MA_AGENT_SIM_FIELD_LENGTH_M", float, "300.0"),
+    ("simulator_headland_length_m", "MA_AGENT_SIM_HEADLAND_M", float, "20.0"),
+    ("simulator_speed_mps", "MA_AGENT_SIM_SPEED_MPS", float, "2.5"),
+    ("simulator_sample_rate_hz", "MA_AGENT_SIM_SAMPLE_HZ", float, "5.0"),
+    ("simulator_passes_per_cycle", "MA_AGENT_SIM_PASSES_PER_CYCLE", int, "8"),
+    ("simulator_base_lat", "MA_AGENT_SIM_BASE_LAT", float, "-22.0"),
+    ("simulator_base_lon", "MA_AGENT_SIM_BASE_LON", float, "-47.0"),
+    ("simulator_altitude_m", "MA_AGENT_SIM_ALTITUDE_M", float, "550.0"),
+    (
+        "simulator_route_file",
+        "MA_AGENT_SIM_ROUTE_FILE",
+        _parse_str,
+        _config_path("routes", "rota_plantio_terracos.geojson"),
+    ),
+    ("simulator_route_format", "MA_AGENT_SIM_ROUTE_FORMAT", _parse_str, "geojson"),
+)
 
 
 __all__ = ["AgentConfig"]
\ No newline at end of file
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from typing import List
 
 from .config import AgentConfig
@@ -10,6 +11,7 @@ from .logging_utils import setup_logging
 from .session import GatewaySession
 from .simulators import PlanterSimulator
 from .state import STATE
+from .transport.base import StreamReactor
 from .transport.bluetooth import BluetoothServer
 from .transport.tcp import TcpServer
 
@@ -19,6 +21,15 @@ LOGGER = logging.getLogger(__name__)
 class GatewayService:
     """Bootstrap and manage the transports that talk to the monitor."""
 
+    __slots__ = (
+        "config",
+        "implement_profile",
+        "telemetry_publisher",
+        "gnss_coordinator",
+        "_servers",
+        "_reactor",
+    )
+
     def __init__(
         self,
         config: AgentConfig | None = None,
@@ -49,19 +60,26 @@ class GatewayService:
         self.telemetry_publisher = telemetry_publisher
         self.gnss_coordinator = gnss_coordinator
         self._servers: List = []
+        # A single reactor thread serves the streams of every transport.
+        self._reactor = StreamReactor()
 
     def start(self) -> None:
         setup_logging()
         LOGGER.info("starting MA gateway service")
+        self._reactor.start()
 
+        # Every transport builds its sessions from the same bound arguments.
+        session_factory = partial(
+            GatewaySession,
+            state=STATE,
+            implement_profile=self.implement_profile,
+            telemetry_publisher=self.telemetry_publisher,
+            gnss_coordinator=self.gnss_coordinator,
+        )
         tcp_server = TcpServer(
             self.config,
-            session_factory=lambda: GatewaySession(
-                state=STATE,
-                implement_profile=self.implement_profile,
-                telemetry_publisher=self.telemetry_publisher,
-                gnss_coordinator=self.gnss_coordinator,
-            ),
+            session_factory=session_factory,
+            reactor=self._reactor,
         )
         tcp_server.start()
         self._servers.append(tcp_server)
@@ -69,12 +87,8 @@ class GatewayService:
         if self.config.enable_bluetooth:
             bt_server = BluetoothServer(
                 self.config,
-                session_factory=lambda: GatewaySession(
-                    state=STATE,
-                    implement_profile=self.implement_profile,
-                    telemetry_publisher=self.telemetry_publisher,
-                    gnss_coordinator=self.gnss_coordinator,
-                ),
+                session_factory=session_factory,
+                reactor=self._reactor,
             )
             bt_server.start()
             self._servers.append(bt_server)
@@ -83,5 +97,22 @@ class GatewayService:
 
         LOGGER.info("service started with transports: %s", [s.name for s in self._servers])
 
+    def stop(self) -> None:
+        """Stop the transports, the stream reactor and the telemetry publisher."""
+
+        LOGGER.info("stopping MA gateway service")
+        servers, self._servers = self._servers, []
+        for server in servers:
+            stop = getattr(server, "stop", None)
+            if callable(stop):
+                try:
+                    stop()
+                except Exception:  # pragma: no cover - defensive cleanup
+                    LOGGER.exception("failed to stop %s transport", server.name)
+        self._reactor.stop()
+        stop = getattr(self.telemetry_publisher, "stop", None)
+        if callable(stop):
+            stop()
+
 
 __all__ = ["GatewayService"]
@@ -3,11 +3,17 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 import sys
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
 from ..paths import IMPLEMENT_CONFIG_FILE
 
@@ -15,12 +21,42 @@ LOGGER = logging.getLogger(__name__)
 
 _DEFAULT_RESOURCE = "implement.vence_tudo.json"
 
+# Default profile shipped in the source checkout's ``config`` directory.
+_CHECKOUT_DEFAULT_FILE = Path(__file__).resolve().parents[2] / "config" / _DEFAULT_RESOURCE
 
-# ``slots`` support for ``dataclasses`` was added in Python 3.10. Use it when
-# available while staying compatible with Python 3.9.
-_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+# Both parsers accept bytes, so files are read in binary mode either way.
+_loads = orjson.loads if orjson is not None else json.loads
 
 
+# ``slots`` support for ``dataclasses`` was added in Python 3.10. Use it when
+# available while staying compatible with Python 3.9.  Profiles are frozen:
+# they are shared by every session and cache their INFO payload.
+_DATACLASS_KWARGS = (
+    {"frozen": True, "slots": True} if sys.version_info >= (3, 10) else {"frozen": True}
+)
+
+
+def _slotted(cls):
+    """Give ``cls`` ``__slots__`` on Python 3.9, where ``slots=True`` is missing.
+
+    Mirrors what ``dataclass(slots=True)`` does: rebuild the class with one
+    slot per field and without the class-level field defaults (the generated
+    ``__init__`` already carries them).
+    """
+
+    if "__slots__" in cls.__dict__:
+        return cls
+    names = tuple(item.name for item in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted
 @dataclass(**_DATACLASS_KWARGS)
 class SectionProfile:
     """Metadata for a group of implement sections (e.g., seed, fertilizer)."""
@@ -50,6 +86,7 @@ class SectionProfile:
         return payload
 
 
+@_slotted
 @dataclass(**_DATACLASS_KWARGS)
 class ImplementProfile:
     """Structured description of the implement attached to the gateway."""
@@ -64,12 +101,22 @@ class ImplementProfile:
     articulated: bool = False
     antenna_to_articulation_m: Optional[float] = None
     articulation_to_tool_m: Optional[float] = None
-    sections: List[SectionProfile] = field(default_factory=list)
+    sections: Tuple[SectionProfile, ...] = ()
+    _payload: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of sections but keep an immutable tuple.
+        object.__setattr__(self, "sections", tuple(self.sections))
+        # Set here: on Python 3.9 ``_slotted`` drops the class-level default
+        # that ``__init__`` relies on for non-init fields.
+        object.__setattr__(self, "_payload", None)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ImplementProfile":
         sections_data: Iterable[Dict[str, Any]] = data.get("sections", [])
-        sections = [SectionProfile.from_dict(item) for item in sections_data]
+        sections = tuple(SectionProfile.from_dict(item) for item in sections_data)
         return cls(
             role=data["role"],
             name=data["name"],
@@ -91,6 +138,21 @@ class ImplementProfile:
         )
 
     def to_payload(self) -> Dict[str, Any]:
+        """Return the profile as sent to the monitor.
+
+        The payload is built on first use (the profile is frozen, so it
+        cannot go stale) and every call gets its own copy of it.
+        """
+
+        cached = self._payload
+        if cached is None:
+            cached = self._build_payload()
+            object.__setattr__(self, "_payload", cached)
+        payload = dict(cached)
+        payload["sections"] = [dict(section) for section in cached["sections"]]
+        return payload
+
+    def _build_payload(self) -> Dict[str, Any]:
         payload: Dict[str, Any] = {
             "role": self.role,
             "name": self.name,
@@ -110,13 +172,15 @@ class ImplementProfile:
 
 
 def _load_json_file(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    return _loads(path.read_bytes())
 
 
+@lru_cache(maxsize=1)
 def _default_payload() -> Dict[str, Any]:
-    data = resources.files("ma_agent.data").joinpath(_DEFAULT_RESOURCE).read_text(encoding="utf-8")
-    return json.loads(data)
+    # The bundled resource never changes, so it is read and parsed only once.
+    # Callers must treat the returned mapping as read-only.
+    data = resources.files("ma_agent.data").joinpath(_DEFAULT_RESOURCE).read_bytes()
+    return _loads(data)
 
 
 def load_implement_profile(explicit_path: Optional[str | Path] = None) -> ImplementProfile:
@@ -126,8 +190,7 @@ def load_implement_profile(explicit_path: Optional[str | Path] = None) -> Implem
     if explicit_path:
         candidates.append(Path(explicit_path))
     candidates.append(IMPLEMENT_CONFIG_FILE)
-    candidates.append(Path(__file__).resolve().parents[2] / "config" / _DEFAULT_RESOURCE)
-
+    candidates.append(_CHECKOUT_DEFAULT_FILE)
 
     for candidate in candidates:
         if candidate and candidate.exists():
@@ -1,15 +1,20 @@
 """Logging helpers for the MA gateway agent."""
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, List, Optional
 
 from .paths import LOG_DIR, LOG_FILE
 
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# Background listener that owns the real (blocking) handlers.
+_LISTENER: Optional[QueueListener] = None
+
 
 def setup_logging(extra_handlers: Iterable[logging.Handler] | None = None) -> None:
     """Configure the root logger used by the agent.
@@ -18,8 +23,14 @@ def setup_logging(extra_handlers: Iterable[logging.Handler] | None = None) -> No
     development) and also writes to a rotating file under
     ``/var/log/ma-agent`` by default.  Consumers can supply additional
     handlers when embedding the service in a different runtime.
+
+    The root logger only enqueues records; a :class:`QueueListener` thread
+    performs the console and disk writes so telemetry and transport threads
+    never block on logging I/O.
     """
 
+    global _LISTENER
+
     LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     root = logging.getLogger()
@@ -34,9 +45,11 @@ def setup_logging(extra_handlers: Iterable[logging.Handler] | None = None) -> No
         datefmt="%Y-%m-%dT%H:%M:%S",
     )
 
+    handlers: List[logging.Handler] = []
+
     stream_handler = logging.StreamHandler()
     stream_handler.setFormatter(formatter)
-    root.addHandler(stream_handler)
+    handlers.append(stream_handler)
 
     file_handler = RotatingFileHandler(
         LOG_FILE,
@@ -44,11 +57,26 @@ def setup_logging(extra_handlers: Iterable[logging.Handler] | None = None) -> No
         backupCount=5,
     )
     file_handler.setFormatter(formatter)
-    root.addHandler(file_handler)
+    handlers.append(file_handler)
 
     if extra_handlers:
-        for handler in extra_handlers:
-            root.addHandler(handler)
+        handlers.extend(extra_handlers)
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root.addHandler(QueueHandler(records))
+    _LISTENER = QueueListener(records, *handlers, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background logging thread."""
+
+    global _LISTENER
+
+    listener, _LISTENER = _LISTENER, None
+    if listener is not None:
+        listener.stop()
 
 
-__all__ = ["setup_logging", "DEFAULT_LOG_LEVEL"]
\ No newline at end of file
+__all__ = ["setup_logging", "stop_logging", "DEFAULT_LOG_LEVEL"]
\ No newline at end of file
@@ -2,9 +2,69 @@
 from __future__ import annotations
 
 import json
-from typing import Iterable, Iterator
+from typing import Dict, Iterable, Iterator
 
-from .messages import Message
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+from .messages import Message, MessageType
+
+ORJSON_AVAILABLE = orjson is not None
+
+
+if ORJSON_AVAILABLE:
+
+    # ``OPT_NON_STR_KEYS`` stringifies int/float/bool/None keys like
+    # ``json.dumps`` does instead of raising.  Known remaining differences
+    # from the stdlib path: NaN/Infinity are written as ``null`` (json emits
+    # the non-standard ``NaN`` tokens), integers beyond 64 bits raise
+    # ``TypeError``, and non-ASCII text is written as UTF-8 rather than
+    # ``\uXXXX`` escapes (both decode to the same message).
+    _DUMP_OPTIONS = orjson.OPT_NON_STR_KEYS
+    _DUMP_LINE_OPTIONS = _DUMP_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+    def _dump_line(data: dict) -> bytes:
+        # The newline is written by orjson into the same output buffer.
+        return orjson.dumps(data, option=_DUMP_LINE_OPTIONS)
+
+    def _dump_payload(data: dict) -> bytes:
+        return orjson.dumps(data, option=_DUMP_OPTIONS)
+
+    _load_line = orjson.loads
+
+else:
+
+    # ``json.dumps`` builds a new encoder whenever options are passed; keep
+    # one around and reuse the module's shared decoder for the inbound side.
+    _JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+    _encode_json = _JSON_ENCODER.encode
+
+    def _dump_line(data: dict) -> bytes:
+        return (_encode_json(data) + "\n").encode("utf-8")
+
+    def _dump_payload(data: dict) -> bytes:
+        return _encode_json(data).encode("utf-8")
+
+    _load_line = json.loads
+
+
+# ``{"type":"<TYPE>","payload":`` for every message type. Encoding splices the
+# serialised payload between this prefix and ``_LINE_SUFFIX`` so the envelope
+# dict from ``Message.to_dict`` is never built on the send path.
+_LINE_PREFIXES: Dict[MessageType, bytes] = {
+    message_type: _dump_line({"type": message_type.value, "payload": None})[: -len(b"null}\n")]
+    for message_type in MessageType
+}
+_LINE_SUFFIX = b"}\n"
+
+
+# Messages without payload (PONG, ...) always encode to the same bytes.
+_EMPTY_PAYLOAD_LINES: Dict[MessageType, bytes] = {
+    message_type: _dump_line(Message(type=message_type).to_dict())
+    for message_type in MessageType
+}
 
 
 class LineCodec:
@@ -12,17 +72,20 @@ class LineCodec:
 
     @staticmethod
     def encode(message: Message) -> bytes:
-        return (json.dumps(message.to_dict(), separators=(",", ":")) + "\n").encode("utf-8")
+        if not message.payload:
+            return _EMPTY_PAYLOAD_LINES[message.type]
+        return _LINE_PREFIXES[message.type] + _dump_payload(message.payload) + _LINE_SUFFIX
 
     @staticmethod
     def decode(line: bytes) -> Message:
-        raw = line.decode("utf-8").strip()
+        # Both decoders accept UTF-8 bytes directly, skipping a str round-trip.
+        raw = line.strip()
         if not raw:
             raise ValueError("empty line")
-        data = json.loads(raw)
+        data = _load_line(raw)
         if not isinstance(data, dict):
             raise ValueError("expected JSON object")
         return Message.from_dict(data)
 
 
-__all__ = ["LineCodec"]
\ No newline at end of file
+__all__ = ["LineCodec", "ORJSON_AVAILABLE"]
@@ -26,6 +26,11 @@ class MessageType(str, Enum):
     NTRIP_CORRECTION_ACK = "NTRIP_CORRECTION_ACK"  # sequence, status, timestamp
 
 
+# Wire value -> member. A plain dict probe is much cheaper than
+# ``MessageType(value)``, which goes through ``EnumMeta.__call__``.
+_TYPE_BY_VALUE: Dict[str, MessageType] = {member.value: member for member in MessageType}
+
+
 # ``slots`` support for ``dataclasses`` arrived in Python 3.10. Prefer slots
 # when available but remain compatible with Python 3.9.
 _DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -33,6 +38,8 @@ _DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 @dataclass(**_DATACLASS_KWARGS)
 class Message:
+    # Hot paths construct messages positionally, ``Message(type, payload)``:
+    # keyword binding costs about as much as the rest of ``__init__``.
     type: MessageType
     payload: Dict[str, Any] = field(default_factory=dict)
 
@@ -41,14 +48,15 @@ class Message:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Message":
-        try:
-            message_type = MessageType(data.get("type"))
-        except Exception as exc:
-            raise ValueError(f"unknown message type: {data!r}") from exc
+        raw_type = data.get("type")
+        # Guard the probe: JSON arrays/objects are unhashable.
+        message_type = _TYPE_BY_VALUE.get(raw_type) if isinstance(raw_type, str) else None
+        if message_type is None:
+            raise ValueError(f"unknown message type: {data!r}")
         payload = data.get("payload") or {}
         if not isinstance(payload, dict):
             raise ValueError("payload must be an object")
-        return cls(type=message_type, payload=payload)
+        return cls(message_type, payload)
 
 
 def error_message(reason: str, *, code: Optional[str] = None, details: Optional[Dict[str, Any]] = None) -> Message:
@@ -57,7 +65,7 @@ def error_message(reason: str, *, code: Optional[str] = None, details: Optional[
         payload["code"] = code
     if details:
         payload["details"] = details
-    return Message(type=MessageType.ERROR, payload=payload)
+    return Message(MessageType.ERROR, payload)
 
 
 def hello_ack(*, version: str, capabilities: Iterable[str]) -> Message:
@@ -76,7 +84,7 @@ def info_message(
     payload: Dict[str, Any] = {"version": version, "uptime_s": uptime_s}
     if implement:
         payload["implement"] = implement
-    return Message(type=MessageType.INFO, payload=payload)
+    return Message(MessageType.INFO, payload)
 
 
 def gnss_fix_message(
@@ -103,6 +111,26 @@ def gnss_fix_message(
     * ``rtk_state`` (str, optional): textual RTK fix state (ex.: ``FLOAT``).
     """
 
+    if (
+        accuracy is not None
+        and sequence is not None
+        and timestamp is not None
+        and rtk_state is not None
+    ):
+        # Simulators and receivers fill every field: build the payload from a
+        # single literal instead of growing it key by key.
+        return Message(
+            MessageType.GNSS_FIX,
+            {
+                "latitude": latitude,
+                "longitude": longitude,
+                "altitude": altitude,
+                "accuracy": accuracy,
+                "sequence": sequence,
+                "timestamp": timestamp,
+                "rtk_state": rtk_state,
+            },
+        )
     payload: Dict[str, Any] = {
         "latitude": latitude,
         "longitude": longitude,
@@ -116,7 +144,7 @@ def gnss_fix_message(
         payload["timestamp"] = timestamp
     if rtk_state is not None:
         payload["rtk_state"] = rtk_state
-    return Message(type=MessageType.GNSS_FIX, payload=payload)
+    return Message(MessageType.GNSS_FIX, payload)
 
 
 def gnss_ack_message(
@@ -127,7 +155,7 @@ def gnss_ack_message(
     payload: Dict[str, Any] = {"sequence": sequence, "status": status}
     if timestamp is not None:
         payload["timestamp"] = timestamp
-    return Message(type=MessageType.GNSS_ACK, payload=payload)
+    return Message(MessageType.GNSS_ACK, payload)
 
 
 def ntrip_correction_message(
@@ -147,14 +175,12 @@ def ntrip_correction_message(
     * ``timestamp`` (float, optional): POSIX timestamp (seconds).
     """
 
-    message_payload: Dict[str, Any] = {
-        "sequence": sequence,
-        "payload": payload,
-        "format": format,
-    }
-    if timestamp is not None:
-        message_payload["timestamp"] = timestamp
-    return Message(type=MessageType.NTRIP_CORRECTION, payload=message_payload)
+    message_payload: Dict[str, Any] = (
+        {"sequence": sequence, "payload": payload, "format": format, "timestamp": timestamp}
+        if timestamp is not None
+        else {"sequence": sequence, "payload": payload, "format": format}
+    )
+    return Message(MessageType.NTRIP_CORRECTION, message_payload)
 
 
 def ntrip_correction_ack_message(
@@ -165,7 +191,7 @@ def ntrip_correction_ack_message(
     payload: Dict[str, Any] = {"sequence": sequence, "status": status}
     if timestamp is not None:
         payload["timestamp"] = timestamp
-    return Message(type=MessageType.NTRIP_CORRECTION_ACK, payload=payload)
+    return Message(MessageType.NTRIP_CORRECTION_ACK, payload)
 
 
 
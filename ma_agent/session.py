@@ -1,12 +1,18 @@
 """Session handling and business logic for monitor communication."""
 from __future__ import annotations
 
-import base64
 import logging
+import os
+import re
 import subprocess
+import sys
+import tempfile
 import time
 import zipfile
-from typing import Callable, Iterable, List, Optional
+from base64 import b64decode
+from binascii import a2b_base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from .implement import ImplementProfile
 from .paths import AGENT_ROOT, UPDATES_DIR
@@ -20,10 +26,58 @@ from .protocol.messages import (
 )
 from .state import AgentState, STATE, VERSION
 from .telemetry import TelemetryPublisher
+from .versioning import read_version
 from .gnss import GnssCoordinator
 
 LOGGER = logging.getLogger(__name__)
 
+# Number of base64 characters decoded per step while writing UPDATE packages.
+# Must be a multiple of 4 so every slice holds whole base64 quanta.
+_UPDATE_DECODE_CHUNK = 64 * 1024
+# Like ``b64decode``, characters outside the base64 alphabet are discarded.
+_NOT_BASE64 = re.compile(r"[^A-Za-z0-9+/=]+")
+
+# Default session clock, bound once at import.
+_time_monotonic = time.monotonic
+
+if sys.version_info >= (3, 11):
+
+    def _decode_correction(encoded: str) -> bytes:
+        # ``a2b_base64`` takes ASCII ``str`` directly, skipping the
+        # ``b64decode`` wrapper and its ``str.encode`` copy.
+        return a2b_base64(encoded, strict_mode=True)
+
+else:  # pragma: no cover - ``strict_mode`` is new in Python 3.11
+
+    def _decode_correction(encoded: str) -> bytes:
+        return b64decode(encoded, validate=True)
+
+# Replies that never change are built once and shared; handlers must treat
+# response payloads as read-only.
+_PONG = Message(type=MessageType.PONG)
+_STATUS_BY_JOB_STATE = {
+    running: Message(type=MessageType.STATUS_RESPONSE, payload={"job_running": running})
+    for running in (False, True)
+}
+# ACKs echo the command's wire value, resolved once here rather than through
+# ``MessageType.<X>.value`` on every reply.
+_ACK_BY_ACTION = {
+    action: Message(MessageType.ACK, {"action": action.value})
+    for action in (
+        MessageType.START_JOB,
+        MessageType.STOP_JOB,
+        MessageType.REBOOT,
+    )
+}
+# UPDATE is acknowledged on receipt; the package is applied in the background.
+_UPDATE_ACCEPTED = Message(
+    MessageType.ACK, {"action": MessageType.UPDATE.value, "status": "accepted"}
+)
+
+# A single worker applies UPDATE packages in arrival order, off the thread
+# that dispatches monitor messages.
+_UPDATE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ma-agent-update")
+
 
 class HandshakeError(Exception):
     """Raised when the monitor fails to perform the mandatory handshake."""
@@ -32,6 +86,24 @@ class HandshakeError(Exception):
 class GatewaySession:
     """Encapsulates one logical conversation with the monitor."""
 
+    __slots__ = (
+        "state",
+        "handshake_complete",
+        "implement_profile",
+        "telemetry_publisher",
+        "gnss_coordinator",
+        "_clock",
+        "_telemetry_subscribed",
+        "_registered_with_publisher",
+        "_last_ack_sequence",
+        "_last_ack_status",
+        "_last_ack_timestamp",
+        "_last_heartbeat_at",
+        "_pending_fix_sequence",
+        "_message_sender",
+        "_sender",
+    )
+
     CAPABILITIES: Iterable[str] = (
         "telemetry/basic",
         "telemetry/rtk",
@@ -40,6 +112,9 @@ class GatewaySession:
         "implement/profile",
         "update/zip",
     )
+    # VERSION and CAPABILITIES are fixed for the life of the process, so every
+    # handshake shares one reply (payloads are read-only once returned).
+    _HELLO_ACK = hello_ack(version=VERSION, capabilities=CAPABILITIES)
 
     def __init__(
         self,
@@ -55,7 +130,7 @@ class GatewaySession:
         self.implement_profile = implement_profile
         self.telemetry_publisher = telemetry_publisher
         self.gnss_coordinator = gnss_coordinator
-        self._clock: Callable[[], float] = clock or time.monotonic
+        self._clock: Callable[[], float] = clock or _time_monotonic
         self._telemetry_subscribed = False
         self._registered_with_publisher = False
         self._last_ack_sequence: Optional[int] = None
@@ -63,13 +138,14 @@ class GatewaySession:
         self._last_ack_timestamp: Optional[float] = None
         self._last_heartbeat_at: Optional[float] = None
         self._pending_fix_sequence: Optional[int] = None
-        self._message_sender: Optional[Callable[[Message], None]] = None
+        self._message_sender: Optional[Callable[[Message], Optional[bool]]] = None
         self._sender: Callable[[Message], None] | None = None
 
 
     # Public API ---------------------------------------------------------
     def handle_message(self, message: Message) -> List[Message]:
-        LOGGER.debug("processing message %s", message)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("processing message %s", message)
         if not self.handshake_complete and message.type is not MessageType.HELLO:
             LOGGER.warning("received %s before HELLO handshake", message.type)
             return [
@@ -79,20 +155,7 @@ class GatewaySession:
                 )
             ]
 
-        handlers = {
-            MessageType.HELLO: self._on_hello,
-            MessageType.PING: self._on_ping,
-            MessageType.INFO: self._on_info_request,
-            MessageType.STATUS_REQUEST: self._on_status_request,
-            MessageType.START_JOB: self._on_start_job,
-            MessageType.STOP_JOB: self._on_stop_job,
-            MessageType.UPDATE: self._on_update,
-            MessageType.REBOOT: self._on_reboot,
-            MessageType.GNSS_ACK: self._on_gnss_ack,
-            MessageType.NTRIP_CORRECTION: self._on_ntrip_correction,
-        }
-
-        handler = handlers.get(message.type)
+        handler = self._HANDLERS.get(message.type)
         if handler is None:
             LOGGER.info("no handler for message %s", message.type)
             return [
@@ -102,7 +165,7 @@ class GatewaySession:
                 )
             ]
 
-        return handler(message)
+        return handler(self, message)
 
     # Lifecycle management -----------------------------------------------
     def close(self) -> None:
@@ -146,7 +209,7 @@ class GatewaySession:
             register = getattr(self.gnss_coordinator, "register_session", None)
             if register:
                 register(self)
-        return [hello_ack(version=VERSION, capabilities=self.CAPABILITIES)]
+        return [self._HELLO_ACK]
 
     def _extract_subscription(self, payload: dict | None) -> bool:
         """Determine if the monitor requested telemetry streaming."""
@@ -154,23 +217,16 @@ class GatewaySession:
         if not payload:
             return True
         subscribe = payload.get("subscribe") or payload.get("subscriptions")
-        if subscribe is None:
+        # Decoded JSON only yields exact builtin types; anything else
+        # (including ``None``) keeps the default subscription.
+        handler = _SUBSCRIPTION_BY_TYPE.get(type(subscribe))
+        if handler is None:
             return True
-        if isinstance(subscribe, bool):
-            return subscribe
-        if isinstance(subscribe, list):
-            return "telemetry/rtk" in subscribe or "telemetry" in subscribe
-        if isinstance(subscribe, dict):
-            if "telemetry/rtk" in subscribe:
-                return bool(subscribe["telemetry/rtk"])
-            telemetry_node = subscribe.get("telemetry")
-            if isinstance(telemetry_node, dict) and "rtk" in telemetry_node:
-                return bool(telemetry_node["rtk"])
-        return True
+        return handler(subscribe)
 
 
     def _on_ping(self, _: Message) -> List[Message]:
-        return [Message(type=MessageType.PONG)]
+        return [_PONG]
 
     def _on_info_request(self, _: Message) -> List[Message]:
         snapshot = self.state.snapshot()
@@ -187,32 +243,17 @@ class GatewaySession:
 
     def _on_status_request(self, _: Message) -> List[Message]:
         snapshot = self.state.snapshot()
-        return [
-            Message(
-                type=MessageType.STATUS_RESPONSE,
-                payload={"job_running": snapshot["job_running"]},
-            )
-        ]
+        return [_STATUS_BY_JOB_STATE[bool(snapshot["job_running"])]]
 
     def _on_start_job(self, message: Message) -> List[Message]:
         self.state.set_job_running(True)
         self.state.mark_command(message.to_dict())
-        return [
-            Message(
-                type=MessageType.ACK,
-                payload={"action": MessageType.START_JOB.value},
-            )
-        ]
+        return [_ACK_BY_ACTION[MessageType.START_JOB]]
 
     def _on_stop_job(self, message: Message) -> List[Message]:
         self.state.set_job_running(False)
         self.state.mark_command(message.to_dict())
-        return [
-            Message(
-                type=MessageType.ACK,
-                payload={"action": MessageType.STOP_JOB.value},
-            )
-        ]
+        return [_ACK_BY_ACTION[MessageType.STOP_JOB]]
 
     def _on_update(self, message: Message) -> List[Message]:
         payload = message.payload
@@ -221,40 +262,60 @@ class GatewaySession:
         if not name or not content_b64:
             return [error_message("missing name/content")]
 
+        # Writing and unpacking a multi-MB package would stall every other
+        # stream served by the reactor; the outcome is pushed once known.
+        _UPDATE_EXECUTOR.submit(self._apply_update, name, content_b64)
+        return [_UPDATE_ACCEPTED]
+
+    def _apply_update(self, name: str, content_b64: str) -> None:
+        try:
+            outcome = self._install_update(name, content_b64)
+        except Exception:
+            LOGGER.exception("failed to apply update %s", name)
+            outcome = error_message("update failed", code="update_failed")
+        self._notify(outcome)
+        if outcome.type is MessageType.INFO:
+            # In production we restart the service but the skeleton keeps it optional.
+            subprocess.Popen(["sudo", "systemctl", "restart", "ma-agent"], close_fds=True)
+
+    def _install_update(self, name: str, content_b64: str) -> Message:
         UPDATES_DIR.mkdir(parents=True, exist_ok=True)
         target = UPDATES_DIR / name
+        # The package is decoded into a temporary file in bounded slices and
+        # then unpacked from the same handle, so it is neither held in memory
+        # nor reopened; ``extractall`` copies each member in 64 KiB blocks.
+        # Only a package that unpacked replaces the one already at ``target``.
+        fd, partial = tempfile.mkstemp(prefix=f".{name}.", suffix=".part", dir=UPDATES_DIR)
         try:
-            data = base64.b64decode(content_b64)
-        except Exception:
-            return [error_message("invalid base64", code="invalid_payload")]
-
-        target.write_bytes(data)
-        LOGGER.info("update package written to %s", target)
+            with open(fd, "w+b") as handle:
+                try:
+                    _write_base64(content_b64, handle)
+                except (TypeError, ValueError):
+                    return error_message("invalid base64", code="invalid_payload")
 
-        try:
-            with zipfile.ZipFile(target, "r") as zf:
-                zf.extractall(AGENT_ROOT)
-            LOGGER.info("update extracted to %s", AGENT_ROOT)
-        except zipfile.BadZipFile:
-            return [error_message("invalid zip", code="invalid_package")]
-
-        # In production we restart the service but the skeleton keeps it optional.
-        subprocess.Popen(["sudo", "systemctl", "restart", "ma-agent"], close_fds=True)
-        return [
-            Message(
-                type=MessageType.ACK,
-                payload={"action": MessageType.UPDATE.value},
-            )
-        ]
+                handle.seek(0)
+                try:
+                    with zipfile.ZipFile(handle, "r") as zf:
+                        zf.extractall(AGENT_ROOT)
+                    LOGGER.info("update extracted to %s", AGENT_ROOT)
+                except zipfile.BadZipFile:
+                    return error_message("invalid zip", code="invalid_package")
+            os.replace(partial, target)
+            partial = None
+            LOGGER.info("update package written to %s", target)
+        finally:
+            if partial is not None:
+                os.unlink(partial)
+        # The package may have replaced VERSION.txt.
+        read_version.cache_clear()
+        return info_message(
+            version=read_version(),
+            uptime_s=self.state.snapshot()["uptime_s"],
+        )
 
     def _on_reboot(self, _: Message) -> List[Message]:
         subprocess.Popen(["sudo", "reboot"], close_fds=True)
-        return [
-            Message(
-                type=MessageType.ACK,
-                payload={"action": MessageType.REBOOT.value},
-            )
-        ]
+        return [_ACK_BY_ACTION[MessageType.REBOOT]]
 
     def _on_gnss_ack(self, message: Message) -> List[Message]:
         payload = message.payload or {}
@@ -264,17 +325,18 @@ class GatewaySession:
         if sequence is None:
             LOGGER.warning("received GNSS_ACK without sequence: %s", payload)
             return []
-        try:
-            sequence_int = int(sequence)
-        except (TypeError, ValueError):
+        sequence_int = _as_sequence(sequence)
+        if sequence_int is None:
             LOGGER.warning("invalid GNSS_ACK sequence %r", sequence)
             return []
-        LOGGER.info(
-            "received GNSS ACK seq=%s status=%s timestamp=%s",
-            sequence_int,
-            status,
-            timestamp,
-        )
+        # One ACK arrives per streamed fix; keep it out of the INFO log.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "received GNSS ACK seq=%s status=%s timestamp=%s",
+                sequence_int,
+                status,
+                timestamp,
+            )
         self._last_ack_sequence = sequence_int
         self._last_ack_status = status
         self._last_ack_timestamp = timestamp if isinstance(timestamp, (int, float)) else None
@@ -293,6 +355,8 @@ class GatewaySession:
         encoded = payload.get("payload")
         format_ = payload.get("format")
         timestamp = payload.get("timestamp")
+        if not isinstance(timestamp, (int, float)):
+            timestamp = None
         if sequence is None or encoded is None or format_ is None:
             return [
                 error_message(
@@ -300,29 +364,55 @@ class GatewaySession:
                     code="invalid_payload",
                 )
             ]
-        try:
-            sequence_int = int(sequence)
-        except (TypeError, ValueError):
+        sequence_int = _as_sequence(sequence)
+        if sequence_int is None:
             return [error_message("invalid sequence", code="invalid_payload")]
         try:
-            correction_bytes = base64.b64decode(encoded, validate=True)
-        except Exception:
+            correction_bytes = _decode_correction(encoded)
+        except (TypeError, ValueError):
             return [error_message("invalid correction payload", code="invalid_payload")]
         if self.gnss_coordinator:
             self.gnss_coordinator.handle_correction(
                 sequence=sequence_int,
                 payload=correction_bytes,
                 format=str(format_),
-                timestamp=timestamp if isinstance(timestamp, (int, float)) else None,
+                timestamp=timestamp,
             )
         return [
             ntrip_correction_ack_message(
                 sequence=sequence_int,
                 status="accepted",
-                timestamp=timestamp if isinstance(timestamp, (int, float)) else None,
+                timestamp=timestamp,
             )
         ]
 
+    # Dispatch table shared by every session of a class: plain functions
+    # called with the session, so no bound methods are created per session or
+    # per message.
+    # MessageType hashes as its (cached) str value, so this probe measured
+    # faster than indexing a list by a per-member ordinal attribute.
+    _HANDLERS: Dict[MessageType, Callable[["GatewaySession", Message], List[Message]]] = {
+        MessageType.HELLO: _on_hello,
+        MessageType.PING: _on_ping,
+        MessageType.INFO: _on_info_request,
+        MessageType.STATUS_REQUEST: _on_status_request,
+        MessageType.START_JOB: _on_start_job,
+        MessageType.STOP_JOB: _on_stop_job,
+        MessageType.UPDATE: _on_update,
+        MessageType.REBOOT: _on_reboot,
+        MessageType.GNSS_ACK: _on_gnss_ack,
+        MessageType.NTRIP_CORRECTION: _on_ntrip_correction,
+    }
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Resolve the inherited table again by handler name, so a subclass
+        # overriding e.g. ``_on_hello`` gets its own method dispatched.
+        cls._HANDLERS = {
+            message_type: getattr(cls, handler.__name__)
+            for message_type, handler in cls._HANDLERS.items()
+        }
+
     # Session state helpers ---------------------------------------------
     @property
     def telemetry_subscribed(self) -> bool:
@@ -355,14 +445,30 @@ class GatewaySession:
         self._last_heartbeat_at = self._clock()
 
     # Transport interaction -------------------------------------------------
-    def attach_sender(self, sender: Callable[[Message], None]) -> None:
-        """Allow the session to push messages asynchronously to the monitor."""
+    def attach_sender(self, sender: Callable[[Message], Optional[bool]]) -> None:
+        """Allow the session to push messages asynchronously to the monitor.
+
+        ``sender`` only queues the message; it may return ``False`` when the
+        transport drops it because the monitor is not reading.
+        """
 
         self._message_sender = sender
 
     def detach_sender(self) -> None:
         self._message_sender = None
 
+    def _notify(self, message: Message) -> None:
+        """Push an out-of-band reply (not telemetry) if a transport is attached."""
+
+        sender = self._message_sender
+        if sender is None:
+            LOGGER.info("session detached; dropping %s", message.type)
+            return
+        try:
+            sender(message)
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception("failed to send %s to monitor", message.type)
+
     def can_stream(self) -> bool:
         return (
             self.handshake_complete
@@ -386,10 +492,14 @@ class GatewaySession:
             LOGGER.debug("no sender available; dropping %s", message.type)
             return False
         try:
-            self._message_sender(message)
+            queued = self._message_sender(message)
         except Exception:  # pragma: no cover - defensive logging
             LOGGER.exception("failed to send %s to monitor", message.type)
             return False
+        if queued is False:
+            # The transport refused it: the monitor is not keeping up.
+            LOGGER.debug("transport backed up; dropping %s", message.type)
+            return False
         if message.type is MessageType.GNSS_FIX:
             sequence = message.payload.get("sequence") if message.payload else None
             if sequence is not None:
@@ -399,4 +509,74 @@ class GatewaySession:
                     LOGGER.debug("unable to mark fix sent for sequence %r", sequence)
         return True
 
+
+def _as_sequence(value: object) -> Optional[int]:
+    """Return ``value`` as a sequence number, or ``None`` if it is not one."""
+
+    # Decoded JSON almost always carries a plain int; only other values go
+    # through ``int()`` and its exception path.
+    if type(value) is int:
+        return value
+    try:
+        return int(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return None
+
+
+def _subscription_from_list(subscribe: list) -> bool:
+    # Plain ``in`` rather than a set probe: list items may be unhashable.
+    return "telemetry/rtk" in subscribe or "telemetry" in subscribe
+
+
+def _subscription_from_dict(subscribe: dict) -> bool:
+    if "telemetry/rtk" in subscribe:
+        return bool(subscribe["telemetry/rtk"])
+    telemetry_node = subscribe.get("telemetry")
+    if isinstance(telemetry_node, dict) and "rtk" in telemetry_node:
+        return bool(telemetry_node["rtk"])
+    return True
+
+
+# ``type(subscribe)`` -> decision for the HELLO ``subscribe`` field.
+_SUBSCRIPTION_BY_TYPE: Dict[type, Callable[[object], bool]] = {
+    bool: bool,
+    list: _subscription_from_list,
+    dict: _subscription_from_dict,
+}
+
+
+def _write_base64(encoded: str, handle) -> None:
+    """Decode ``encoded`` into ``handle`` without materialising the payload.
+
+    The text is processed in bounded slices so only one decoded chunk is held
+    in memory at a time.  It is accepted exactly as ``b64decode`` would:
+    characters outside the base64 alphabet (line breaks, stray ``-``...) are
+    dropped before grouping into quanta, and an incomplete quantum is
+    carried over to the next slice.
+    """
+
+    if not isinstance(encoded, str):
+        raise TypeError("base64 payload must be a string")
+    pending = ""
+    for start in range(0, len(encoded), _UPDATE_DECODE_CHUNK):
+        text = encoded[start:start + _UPDATE_DECODE_CHUNK]
+        if not text.isascii():
+            raise ValueError("base64 payload must be ASCII")
+        piece = pending + _NOT_BASE64.sub("", text)
+        if "=" in piece:
+            # Padding ends a well-formed payload, so the rest is normally
+            # empty; binascii applies the padding rules to it in one go.
+            rest = encoded[start + _UPDATE_DECODE_CHUNK:]
+            if not rest.isascii():
+                raise ValueError("base64 payload must be ASCII")
+            handle.write(a2b_base64(piece + _NOT_BASE64.sub("", rest)))
+            return
+        usable = len(piece) - len(piece) % 4
+        handle.write(a2b_base64(piece[:usable]))
+        pending = piece[usable:]
+    if pending:
+        # Leftover characters can only be a truncated quantum.
+        raise ValueError("truncated base64 payload")
+
+
 __all__ = ["GatewaySession", "HandshakeError"]
\ No newline at end of file
@@ -4,13 +4,43 @@ from __future__ import annotations
 import json
 import logging
 import math
+import operator
+import os
 import threading
 import time
-from dataclasses import dataclass
+from array import array
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import count, repeat
 from pathlib import Path
-from typing import Iterable, List, Optional, Tuple
-
-from ..articulation import Coordinate, compute_articulated_centers
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None  # type: ignore[assignment]
+
+from ..articulation import (
+    ArticulationGeometry,
+    ArticulationTrack,
+    fill_articulation_track,
+)
 from ..implement import ImplementProfile
 from ..paths import AGENT_ROOT
 from ..protocol.messages import Message, MessageType
@@ -18,23 +48,239 @@ from ..telemetry import TelemetryPublisher
 
 
 _EARTH_RADIUS_M = 6_378_137.0
+# ``math.degrees`` multiplies by this same constant.
+_DEGREES_PER_RADIAN = 180.0 / math.pi
+_RADIANS_PER_DEGREE = math.pi / 180.0
+_atan2 = math.atan2
+_hypot = math.hypot
+_sin = math.sin
+_sub = operator.sub
+_monotonic = time.monotonic
+
+# A session further behind its schedule than this restarts pacing from "now"
+# instead of bursting fixes to catch up.
+_MAX_SCHEDULE_LAG_S = 0.5
+# Sessions that cannot stream yet are polled at this interval.
+_STREAM_RETRY_S = 0.2
+# Upper bound on waiting for the dispatcher thread to exit on ``stop``.
+_DISPATCHER_JOIN_TIMEOUT_S = 0.5
+# RTK state reported with each fix, indexed by the planter ``active`` flag.
+_RTK_STATE = ("HOLD", "FIXED")
 LOGGER = logging.getLogger(__name__)
 
+# Both parsers accept bytes, so route files are read in binary mode either way.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+class _Point(NamedTuple):
+    """Route vertex in the local ENU frame.
+
+    A :class:`~typing.NamedTuple` keeps construction at tuple speed; routes
+    are densified into one point per emitted fix.
+    """
 
-@dataclass(frozen=True)
-class _Point:
     east_m: float
     north_m: float
     active: bool
 
-@dataclass(frozen=True)
-class _Sample:
+
+class _Sample(NamedTuple):
     point: _Point
     heading_deg: float
     speed_mps: float
     time_delta_s: float
 
 
+class _Columns:
+    """Base for tables of equally long ``array`` columns named in ``_COLUMNS``."""
+
+    __slots__ = ()
+    _COLUMNS: Tuple[str, ...] = ()
+
+    def freeze(self) -> None:
+        """Make every column read-only before the table is shared.
+
+        Each column is swapped for a read-only ``memoryview`` of itself; the
+        view also pins the array, so it can no longer grow either.  Reads and
+        iteration cost the same as on the arrays.
+        """
+
+        for name in self._COLUMNS:
+            setattr(self, name, memoryview(getattr(self, name)).toreadonly())
+
+    def rows(self) -> Iterator[tuple]:
+        """Yield one plain tuple per row, fields in ``_COLUMNS`` order."""
+
+        return zip(*[getattr(self, name) for name in self._COLUMNS])
+
+
+class _SampleColumns(_Columns):
+    """One simulator cycle stored by column.
+
+    Positions, heading, speed and time step live in flat ``array('d')``
+    columns and the active flag in an ``array('b')``, so a cycle costs a few
+    dozen bytes per sample and each stream walks it with :meth:`rows` instead
+    of dereferencing a ``_Sample`` and its ``_Point`` for every fix.
+    ``latitude``/``longitude`` are projected once the positions are final.
+    Indexing and iteration still produce :class:`_Sample` objects.
+    """
+
+    _COLUMNS = (
+        "east",
+        "north",
+        "latitude",
+        "longitude",
+        "active",
+        "heading_deg",
+        "speed_mps",
+        "time_delta_s",
+    )
+    __slots__ = _COLUMNS + ("articulation",)
+
+    def __init__(self) -> None:
+        self.east = array("d")
+        self.north = array("d")
+        self.latitude = array("d")
+        self.longitude = array("d")
+        self.active = array("b")
+        self.heading_deg = array("d")
+        self.speed_mps = array("d")
+        self.time_delta_s = array("d")
+        # Replayed implement motion, for articulated implements only.
+        self.articulation: Optional[_ArticulationColumns] = None
+
+    def __len__(self) -> int:
+        return len(self.east)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_Sample, List[_Sample]]:
+        if isinstance(index, slice):
+            return [self._sample(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sample index out of range")
+        return self._sample(index)
+
+    def __iter__(self) -> Iterator[_Sample]:
+        for index in range(len(self)):
+            yield self._sample(index)
+
+    def extend(
+        self,
+        east: Iterable[float],
+        north: Iterable[float],
+        active: Iterable[bool],
+        heading_deg: Iterable[float],
+        speed_mps: Iterable[float],
+        time_delta_s: Iterable[float],
+    ) -> None:
+        """Append whole columns; ``latitude``/``longitude`` are set separately."""
+
+        self.east.extend(east)
+        self.north.extend(north)
+        self.active.extend(active)
+        self.heading_deg.extend(heading_deg)
+        self.speed_mps.extend(speed_mps)
+        self.time_delta_s.extend(time_delta_s)
+
+    def freeze(self) -> None:
+        super().freeze()
+        if self.articulation is not None:
+            self.articulation.freeze()
+
+    def _sample(self, index: int) -> _Sample:
+        return _Sample(
+            point=_Point(self.east[index], self.north[index], bool(self.active[index])),
+            heading_deg=self.heading_deg[index],
+            speed_mps=self.speed_mps[index],
+            time_delta_s=self.time_delta_s[index],
+        )
+
+
+class _ArticulationColumns(_Columns):
+    """Articulated implement motion replayed over a whole cycle.
+
+    The cycle is deterministic and every session restarts the articulation
+    state with it, so the replay runs once when the cycle is built; joint and
+    implement positions are projected to lat/lon at the same time.
+    """
+
+    _COLUMNS = (
+        "joint_x",
+        "joint_y",
+        "implement_x",
+        "implement_y",
+        "joint_lat",
+        "joint_lon",
+        "implement_lat",
+        "implement_lon",
+        "axis_x",
+        "axis_y",
+        "theta",
+        "has_motion",
+    )
+    __slots__ = _COLUMNS
+
+    def __init__(
+        self,
+        track: ArticulationTrack,
+        project: Callable[[Iterable[float], Iterable[float]], Tuple[array, array]],
+    ) -> None:
+        columns = track.columns()
+        self.joint_x = columns["joint_x"]
+        self.joint_y = columns["joint_y"]
+        self.implement_x = columns["cur_x"]
+        self.implement_y = columns["cur_y"]
+        self.joint_lat, self.joint_lon = project(self.joint_x, self.joint_y)
+        self.implement_lat, self.implement_lon = project(self.implement_x, self.implement_y)
+        self.axis_x = columns["axis_x"]
+        self.axis_y = columns["axis_y"]
+        self.theta = columns["theta"]
+        self.has_motion = columns["significant_motion"]
+
+
+def _sample_kinematics(
+    distances: Sequence[float],
+    bearings: Sequence[float],
+    active: Sequence[bool],
+    oscillations: Sequence[float],
+    base_speed: float,
+    idle_time_delta: float,
+    headings: MutableSequence[float],
+    speeds: MutableSequence[float],
+    time_deltas: MutableSequence[float],
+) -> None:
+    """Fill the heading, speed and time step of every sample in place.
+
+    ``bearings`` are radians from north of each sample's displacement.
+    Stationary samples keep the previous heading, report no speed and wait
+    ``idle_time_delta``.  Only scalars and indexable buffers are touched so
+    Numba can compile the loop as is.
+    """
+
+    heading = 0.0
+    for index in range(len(distances)):
+        distance = distances[index]
+        if distance > 0.0:
+            heading = (bearings[index] * _DEGREES_PER_RADIAN + 360.0) % 360.0
+            # The headland slowdown keeps the variation inside the
+            # [-0.15, 0.08] band, so it needs no clamping.
+            oscillation = oscillations[index]
+            variation = oscillation if active[index] else oscillation - 0.06
+            speed = max(0.05, base_speed * (1.0 + variation))
+            speeds[index] = speed
+            time_deltas[index] = distance / speed
+        else:
+            speeds[index] = 0.0
+            time_deltas[index] = idle_time_delta
+        headings[index] = heading
+
+
+# With Numba the kernel takes ``array`` buffers and runs compiled; without
+# it the same function runs on the plain lists.
+_sample_kinematics_jit = njit(cache=True)(_sample_kinematics) if njit is not None else None
+
+
 class PlanterSimulator(TelemetryPublisher):
     """Simulate a planter performing serpentine passes on a rectangular field."""
 
@@ -78,6 +324,14 @@ class PlanterSimulator(TelemetryPublisher):
         self.accuracy_m = accuracy_m
         self.passes_per_cycle = passes_per_cycle
         self.loop_forever = loop_forever
+        # Local tangent-plane projection around the base point; ``base_lat`` is
+        # fixed, so each conversion reduces to a multiply and an add per axis.
+        meters_per_degree = _EARTH_RADIUS_M / _DEGREES_PER_RADIAN
+        cos_base_lat = math.cos(math.radians(base_lat))
+        self._north_m_per_deg = meters_per_degree
+        self._east_m_per_deg = meters_per_degree * cos_base_lat
+        self._lat_deg_per_m = 1.0 / meters_per_degree
+        self._lon_deg_per_m = 1.0 / (meters_per_degree * cos_base_lat)
         self._external_route_format: Optional[str] = None
         route_info = self._load_external_route(
             route_points=route_points, route_file=route_file, route_format=route_format
@@ -93,6 +347,9 @@ class PlanterSimulator(TelemetryPublisher):
         width_m = (implement_profile.row_count * implement_profile.row_spacing_m) if implement_profile else 13.0
         self.implement_width_m = width_m
         self.row_count = implement_profile.row_count if implement_profile else 26
+        # Every section follows the planter state, so only two section lists
+        # ever exist; they are shared, immutable, and indexed by ``active``.
+        self._sections_by_state = ((False,) * self.row_count, (True,) * self.row_count)
         self.is_articulated = bool(implement_profile.articulated) if implement_profile else False
         antenna_to_joint = (
             float(implement_profile.antenna_to_articulation_m)
@@ -110,9 +367,30 @@ class PlanterSimulator(TelemetryPublisher):
         self.offset_longitudinal_m = 0.0
         self.offset_lateral_m = 0.0
         self.articulation_mode = "articulated" if self.is_articulated else "fixed"
+        # Apart from the articulation, the implement part of a fix depends only
+        # on ``active``: both variants are built once and shared, read-only.
+        self._implement_by_state = tuple(
+            self._implement_template(active) for active in (False, True)
+        )
+        # Geometry constants are fixed for the simulator lifetime.
+        self.articulation_geometry = ArticulationGeometry.from_offsets(
+            distancia_antena=self.antenna_to_articulation_m,
+            offset_longitudinal=self.offset_longitudinal_m,
+            offset_lateral=self.offset_lateral_m,
+            work_width_m=self.implement_width_m,
+            articulation_to_tool_m=self.articulation_to_tool_m,
+        )
 
-        self._workers: dict = {}
-        self._lock = threading.Lock()
+        # Session -> stream. Single dict operations are atomic, so the fast
+        # paths need no lock; ``stop`` swaps in a fresh dict before iterating.
+        self._streams: dict = {}
+        # Started with the first session; one thread serves all of them.
+        self._dispatcher: Optional[_PlanterDispatcher] = None
+        self._dispatcher_lock = threading.Lock()
+        # The cycle depends only on the fixed parameters above; it is built on
+        # first use and then shared, read-only, by every session.
+        self._cycle: Optional[_SampleColumns] = None
+        self._cycle_lock = threading.Lock()
 
         if self._external_route:
             LOGGER.info(
@@ -128,92 +406,130 @@ class PlanterSimulator(TelemetryPublisher):
 
     # TelemetryPublisher API -------------------------------------------------
     def register_session(self, session) -> None:
-        worker = _PlanterWorker(simulator=self, session=session)
-        with self._lock:
-            self._workers[session] = worker
-        worker.start()
+        stream = _SessionStream(session)
+        self._streams[session] = stream
+        self._running_dispatcher().add(stream, _monotonic())
 
     def unregister_session(self, session) -> None:
-        with self._lock:
-            worker = self._workers.pop(session, None)
-        if worker:
-            worker.stop()
-            worker.join(timeout=2.0)
+        stream = self._streams.pop(session, None)
+        dispatcher = self._dispatcher
+        if stream is not None and dispatcher is not None:
+            dispatcher.cancel(stream)
 
     def stop(self) -> None:
-        """Stop all background workers."""
+        """Stop streaming to every session and the dispatcher thread."""
 
-        with self._lock:
-            workers = list(self._workers.values())
-            self._workers.clear()
-        for worker in workers:
-            worker.stop()
-        for worker in workers:
-            worker.join(timeout=2.0)
+        previous, self._streams = self._streams, {}
+        for stream in previous.values():
+            stream.cancelled = True
+        with self._dispatcher_lock:
+            dispatcher, self._dispatcher = self._dispatcher, None
+        if dispatcher is not None:
+            dispatcher.stop()
 
     # Helpers ----------------------------------------------------------------
-    def _on_worker_finished(self, session) -> None:
-        with self._lock:
-            self._workers.pop(session, None)
+    def _running_dispatcher(self) -> _PlanterDispatcher:
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            with self._dispatcher_lock:
+                if self._dispatcher is None:
+                    self._dispatcher = _PlanterDispatcher(self)
+                    self._dispatcher.start()
+                dispatcher = self._dispatcher
+        return dispatcher
+
+    def _on_stream_finished(self, stream: _SessionStream) -> None:
+        if self._streams.get(stream.session) is stream:
+            self._streams.pop(stream.session, None)
 
     def _step_distance(self) -> float:
         return self.speed_mps / self.sample_rate_hz
 
-    def _cycle_samples(self) -> List[_Sample]:
-        if self._external_route:
-            return self._build_samples_from_points(self._external_route)
-        points = self._serpentine_points()
+    def _shared_cycle(self) -> _SampleColumns:
+        """Return the cycle streamed to every session, building it only once."""
+
+        cycle = self._cycle
+        if cycle is None:
+            with self._cycle_lock:
+                if self._cycle is None:
+                    cycle = self._cycle_samples()
+                    cycle.freeze()
+                    self._cycle = cycle
+                cycle = self._cycle
+        return cycle
+
+    def _cycle_samples(self) -> _SampleColumns:
+        points = self._external_route or self._serpentine_points()
         return self._build_samples_from_points(points)
 
     def _serpentine_points(self) -> List[_Point]:
         step = self._step_distance()
+        width = self.implement_width_m
+        field_length = self.field_length_m
+        headland = self.headland_length_m
+        lane_count = max(1, self.passes_per_cycle)
+        segment = self._segment_points
         points: List[_Point] = []
         lane_index = 0
         direction = 1  # 1 => increasing north, -1 => decreasing
         last_point: Optional[Tuple[float, float]] = None
-        passes_completed = 0
-        target_passes = max(2, self.passes_per_cycle)
-
-        while passes_completed < target_passes:
-            x = lane_index * self.implement_width_m
-            start_y = 0.0 if direction > 0 else self.field_length_m
-            end_y = self.field_length_m if direction > 0 else 0.0
-
-            for pt in self._interpolate((x, start_y), (x, end_y), step, last_point):
-                points.append(_Point(pt[0], pt[1], True))
-                last_point = pt
-
-            headland_y = end_y + (direction * self.headland_length_m)
-            if self.headland_length_m > 0:
-                for pt in self._interpolate((x, end_y), (x, headland_y), step, last_point):
-                    if pt == last_point:
-                        continue
-                    points.append(_Point(pt[0], pt[1], False))
-                    last_point = pt
 
-            next_lane = (lane_index + 1) % max(1, self.passes_per_cycle)
-            next_x = next_lane * self.implement_width_m
-            for pt in self._interpolate((x, headland_y), (next_x, headland_y), step, last_point):
-                if pt == last_point:
-                    continue
-                points.append(_Point(pt[0], pt[1], False))
-                last_point = pt
+        # The north-south legs of a lane (pass, into and out of the headland)
+        # only differ from those of any other lane running the same way by
+        # their east offset, so their north coordinates are computed once per
+        # direction and reused; only the short headland crossing is built per
+        # lane.
+        north_legs = {}
+        for leg_direction in (1, -1):
+            start_y = 0.0 if leg_direction > 0 else field_length
+            end_y = field_length if leg_direction > 0 else 0.0
+            headland_y = end_y + (leg_direction * headland)
+            north_legs[leg_direction] = (
+                self._leg_norths(start_y, end_y, step),
+                self._leg_norths(end_y, headland_y, step) if headland > 0 else None,
+                self._leg_norths(headland_y, end_y, step),
+                headland_y,
+            )
 
-            next_direction = -direction
-            start_next_y = 0.0 if next_direction > 0 else self.field_length_m
-            for pt in self._interpolate((next_x, headland_y), (next_x, start_next_y), step, last_point):
-                if pt == last_point:
-                    continue
-                points.append(_Point(pt[0], pt[1], False))
-                last_point = pt
+        for _ in range(max(2, self.passes_per_cycle)):
+            x = lane_index * width
+            pass_norths, into_headland, out_of_headland, headland_y = north_legs[direction]
+            next_lane = (lane_index + 1) % lane_count
+            next_x = next_lane * width
+            # The next pass runs the other way, so it starts where this one ended.
+            legs = [(x, pass_norths, True)]
+            if into_headland is not None:
+                legs.append((x, into_headland, False))
+            legs.append((x, None, False))  # across the headland
+            legs.append((next_x, out_of_headland, False))
+
+            for leg_x, norths, active in legs:
+                if norths is None:
+                    leg_points = segment(
+                        leg_x, headland_y, next_x, headland_y, step, last_point, active
+                    )
+                else:
+                    # Only the first point can repeat the end of the previous leg.
+                    first = 1 if last_point == (leg_x, norths[0]) else 0
+                    leg_points = [_Point(leg_x, north, active) for north in norths[first:]]
+                if leg_points:
+                    points.extend(leg_points)
+                    tail = leg_points[-1]
+                    last_point = (tail.east_m, tail.north_m)
 
             lane_index = next_lane
-            direction = next_direction
-            passes_completed += 1
+            direction = -direction
 
         return points
 
-    def _build_samples_from_points(self, points: List[_Point]) -> List[_Sample]:
+    @classmethod
+    def _leg_norths(cls, start_y: float, end_y: float, step: float) -> List[float]:
+        """North coordinates of a north-south leg, as ``_segment_points`` places them."""
+
+        leg = cls._segment_points(0.0, start_y, 0.0, end_y, step, None, True)
+        return [point.north_m for point in leg]
+
+    def _build_samples_from_points(self, points: List[_Point]) -> _SampleColumns:
         filtered_points = (
             self._prevent_sideways_segments(points)
             if self._external_route_format == "geojson"
@@ -222,59 +538,111 @@ class PlanterSimulator(TelemetryPublisher):
         densified_points = self._densify_points(filtered_points)
         if self._external_route_format == "geojson":
             densified_points = self._prevent_sideways_segments(densified_points)
-        samples: List[_Sample] = []
+        samples = _SampleColumns()
         if not densified_points:
             return samples
 
-        last_heading = 0.0
-        for index, point in enumerate(densified_points):
-            if index == 0 and len(densified_points) > 1:
-                reference = densified_points[1]
-                delta_east = reference.east_m - point.east_m
-                delta_north = reference.north_m - point.north_m
-            elif index > 0:
-                previous = densified_points[index - 1]
-                delta_east = point.east_m - previous.east_m
-                delta_north = point.north_m - previous.north_m
-            else:
-                delta_east = 0.0
-                delta_north = 0.0
-
-            distance = math.hypot(delta_east, delta_north)
-            if distance > 0.0:
-                heading = (math.degrees(math.atan2(delta_east, delta_north)) + 360.0) % 360.0
-                speed_factor = 1.0 + self._speed_variation(index=index, is_active=point.active)
-                target_speed = max(0.05, self.speed_mps * speed_factor)
-                speed = target_speed
-                last_heading = heading
-                time_delta = distance / speed if speed > 0.0 else 1.0 / self.sample_rate_hz
-            else:
-                heading = last_heading
-                speed = 0.0
-                time_delta = 1.0 / self.sample_rate_hz
-
-            samples.append(
-                _Sample(point=point, heading_deg=heading, speed_mps=speed, time_delta_s=time_delta)
+        # Positions, deltas, distances and bearings are derived a whole column
+        # at a time by mapping C builtins; only the heading held across stops
+        # and the speed of moving samples need the per-sample loop, which is
+        # compiled by Numba when it is installed.
+        east = [point.east_m for point in densified_points]
+        north = [point.north_m for point in densified_points]
+        active = [point.active for point in densified_points]
+        # Each delta runs from the previous sample; the first sample takes the
+        # direction of the first segment, hence the negation.
+        delta_east = list(map(_sub, east, (east[1:2] or east) + east[:-1]))
+        delta_north = list(map(_sub, north, (north[1:2] or north) + north[:-1]))
+        delta_east[0] = -delta_east[0]
+        delta_north[0] = -delta_north[0]
+        distances = list(map(_hypot, delta_east, delta_north))
+        bearings = map(_atan2, delta_east, delta_north)
+
+        sample_count = len(densified_points)
+        oscillations = self._speed_oscillations(sample_count)
+        idle_time_delta = 1.0 / self.sample_rate_hz
+        if _sample_kinematics_jit is None:
+            headings = [0.0] * sample_count
+            speeds = [0.0] * sample_count
+            time_deltas = [0.0] * sample_count
+            _sample_kinematics(
+                distances,
+                list(bearings),
+                active,
+                oscillations,
+                self.speed_mps,
+                idle_time_delta,
+                headings,
+                speeds,
+                time_deltas,
+            )
+        else:  # pragma: no cover - exercised only with numba installed
+            headings = array("d", bytes(8 * sample_count))
+            speeds = array("d", bytes(8 * sample_count))
+            time_deltas = array("d", bytes(8 * sample_count))
+            _sample_kinematics_jit(
+                array("d", distances),
+                array("d", bearings),
+                array("b", active),
+                array("d", oscillations),
+                self.speed_mps,
+                idle_time_delta,
+                headings,
+                speeds,
+                time_deltas,
             )
 
+        samples.extend(east, north, active, headings, speeds, time_deltas)
+        samples.latitude, samples.longitude = self._enu_to_geodetic_columns(
+            samples.east, samples.north
+        )
+        if self.is_articulated:
+            samples.articulation = self._replay_articulation(samples)
         return samples
 
+    def _replay_articulation(self, samples: _SampleColumns) -> _ArticulationColumns:
+        track = fill_articulation_track(
+            ArticulationTrack(capacity=len(samples)),
+            zip(samples.east, samples.north),
+            # ``math.radians`` multiplies by this same constant.
+            [heading * _RADIANS_PER_DEGREE for heading in samples.heading_deg],
+            self.articulation_geometry,
+        )
+        return _ArticulationColumns(track, self._enu_to_geodetic_columns)
+
     def _densify_points(self, points: List[_Point]) -> List[_Point]:
         if not points:
             return []
 
         target_rate = max(self.sample_rate_hz, 2.0)
         max_step_distance = max(1e-6, self.speed_mps / target_rate)
+        segment = self._segment_points
         densified: List[_Point] = [points[0]]
-        last_point = (points[0].east_m, points[0].north_m)
+        append = densified.append
+        x0, y0 = points[0].east_m, points[0].north_m
 
         for point in points[1:]:
-            start = (densified[-1].east_m, densified[-1].north_m)
-            for candidate in self._interpolate(start, (point.east_m, point.north_m), max_step_distance, last_point):
-                densified.append(
-                    _Point(east_m=candidate[0], north_m=candidate[1], active=point.active)
-                )
-                last_point = candidate
+            dx = point.east_m - x0
+            dy = point.north_m - y0
+            distance = _hypot(dx, dy)
+            if distance == 0.0:
+                continue
+            if distance / max_step_distance <= 1.0:
+                # Already dense enough (always the case for the serpentine
+                # pattern): the leg is its end point alone, computed exactly
+                # as ``_segment_points`` would.
+                x0 += dx
+                y0 += dy
+                append(_Point(x0, y0, point.active))
+                continue
+            # Each segment starts on the previous densified point, so passing
+            # it as ``last_point`` drops exactly that junction duplicate.
+            leg_points = segment(
+                x0, y0, point.east_m, point.north_m, max_step_distance, (x0, y0), point.active
+            )
+            densified.extend(leg_points)
+            tail = leg_points[-1]
+            x0, y0 = tail.east_m, tail.north_m
 
         return densified
 
@@ -325,79 +693,97 @@ class PlanterSimulator(TelemetryPublisher):
         return filtered
 
 
-    def _speed_variation(self, *, index: int, is_active: bool) -> float:
-        """Return a small multiplier offset applied to the base speed.
+    @staticmethod
+    def _speed_oscillations(count: int) -> List[float]:
+        """Return the speed variation along the pass for samples ``0 .. count - 1``.
 
         The variation is deterministic so the path is repeatable, while still
-        adding subtle changes that mimic the tractor slowing down on headlands
-        and gentle oscillations along the pass.
+        adding gentle oscillations (+/- 4 %) along the pass; headland samples
+        subtract a further 6 % on top.  The whole table is built in one pass
+        when the cycle is.
         """
 
-        oscillation = math.sin(index * 0.11) * 0.04  # +/- 4 % variation
-        headland_adjustment = -0.06 if not is_active else 0.0
-        variation = oscillation + headland_adjustment
-        return max(-0.15, min(0.08, variation))
+        return [_sin(index * 0.11) * 0.04 for index in range(count)]
 
 
     @staticmethod
-    def _interpolate(
-        start: Tuple[float, float],
-        end: Tuple[float, float],
+    def _segment_points(
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
         step: float,
         last_point: Optional[Tuple[float, float]],
-    ) -> Iterable[Tuple[float, float]]:
-        x0, y0 = start
-        x1, y1 = end
-        distance = math.hypot(x1 - x0, y1 - y0)
+        active: bool,
+    ) -> List[_Point]:
+        """Return the points of one straight leg from ``(x0, y0)`` to ``(x1, y1)``.
+
+        Consecutive points are at most ``step`` apart and the leg ends exactly
+        on ``(x1, y1)``.  Only the first point can repeat the end of the
+        previous leg (``last_point``), so it is the only one compared and
+        dropped; the rest are built in a single comprehension.
+        """
+
+        dx = x1 - x0
+        dy = y1 - y0
+        distance = math.hypot(dx, dy)
         if distance == 0:
-            if last_point != (x0, y0):
-                yield (x0, y0)
-            return
+            return [] if last_point == (x0, y0) else [_Point(x0, y0, active)]
         steps = max(1, int(math.ceil(distance / step)))
-        for index in range(steps + 1):
-            t = min(1.0, index / steps)
-            point = (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t)
-            if last_point == point:
-                continue
-            yield point
+        first = 1 if last_point == (x0, y0) else 0
+        return [
+            _Point(x0 + dx * (index / steps), y0 + dy * (index / steps), active)
+            for index in range(first, steps + 1)
+        ]
 
-    def _to_geodetic(self, point: _Point) -> Tuple[float, float]:
-        dlat = (point.north_m / _EARTH_RADIUS_M) * (180.0 / math.pi)
-        dlon = (point.east_m / (_EARTH_RADIUS_M * math.cos(math.radians(self.base_lat)))) * (
-            180.0 / math.pi
+    def _enu_to_geodetic_columns(
+        self, east: Iterable[float], north: Iterable[float]
+    ) -> Tuple[array, array]:
+        """Project whole east/north columns; returns ``(latitude, longitude)`` arrays."""
+
+        base_lat = self.base_lat
+        base_lon = self.base_lon
+        lat_per_m = self._lat_deg_per_m
+        lon_per_m = self._lon_deg_per_m
+        return (
+            array("d", [base_lat + value * lat_per_m for value in north]),
+            array("d", [base_lon + value * lon_per_m for value in east]),
         )
-        return (self.base_lat + dlat, self.base_lon + dlon)
-
-    def _enu_to_geodetic(self, east_m: float, north_m: float) -> Tuple[float, float]:
-        dummy = _Point(east_m=east_m, north_m=north_m, active=True)
-        return self._to_geodetic(dummy)
 
     def _geodetic_to_enu(self, latitude: float, longitude: float) -> Tuple[float, float]:
-        dlat = math.radians(latitude - self.base_lat)
-        dlon = math.radians(longitude - self.base_lon)
-        north = dlat * _EARTH_RADIUS_M
-        east = dlon * _EARTH_RADIUS_M * math.cos(math.radians(self.base_lat))
-        return (east, north)
+        return (
+            (longitude - self.base_lon) * self._east_m_per_deg,
+            (latitude - self.base_lat) * self._north_m_per_deg,
+        )
 
 
+    def _implement_template(self, active: bool) -> dict:
+        implement_payload = {
+            "active": active,
+            "sections": self._sections_by_state[active],
+        }
+        if self.implement_profile:
+            implement_payload["mode"] = self.articulation_mode
+        return implement_payload
+
     def _build_message(
         self,
-        sample: _Sample,
+        latitude: float,
+        longitude: float,
+        active: bool,
+        heading_deg: float,
+        speed_mps: float,
         sequence: int,
         articulation: Optional[dict] = None,
+        timestamp: Optional[float] = None,
     ) -> Message:
-        point = sample.point
-        latitude, longitude = self._to_geodetic(point)
-        timestamp = time.time()
-        sections = [point.active] * self.row_count
-        implement_payload = {
-            "active": point.active,
-            "sections": sections,
-        }
-        if self.implement_profile:
-            implement_payload["mode"] = self.articulation_mode
+        # ``active`` may arrive as the 0/1 stored in the cycle columns.
+        active = bool(active)
+        if timestamp is None:
+            timestamp = time.time()
+        implement_payload = self._implement_by_state[active]
         if articulation:
-            implement_payload["articulation"] = articulation
+            implement_payload = {**implement_payload, "articulation": articulation}
 
         payload = {
             "latitude": latitude,
@@ -406,12 +792,12 @@ class PlanterSimulator(TelemetryPublisher):
             "accuracy": self.accuracy_m,
             "sequence": sequence,
             "timestamp": timestamp,
-            "heading_deg": sample.heading_deg,
-            "speed_mps": sample.speed_mps,
-            "rtk_state": "FIXED" if point.active else "HOLD",
+            "heading_deg": heading_deg,
+            "speed_mps": speed_mps,
+            "rtk_state": _RTK_STATE[active],
             "implement": implement_payload,
         }
-        return Message(type=MessageType.GNSS_FIX, payload=payload)
+        return Message(MessageType.GNSS_FIX, payload)
 
     def _load_external_route(
         self,
@@ -440,7 +826,7 @@ class PlanterSimulator(TelemetryPublisher):
 
     def _load_route_file(self, path: Path, route_format: Optional[str]) -> Tuple[List[_Point], str]:
 
-        data = json.loads(path.read_text())
+        data = _loads(path.read_bytes())
         fmt = (route_format or self._infer_route_format(path, data)).lower()
         if fmt not in {"json", "geojson"}:
             raise ValueError(f"Unsupported route format: {fmt}")
@@ -450,29 +836,9 @@ class PlanterSimulator(TelemetryPublisher):
 
     @staticmethod
     def _resolve_route_path(route_file: str) -> Path:
-        path = Path(route_file)
-        if path.exists():
-            return path
-
-        repo_routes = Path(__file__).resolve().parents[2] / "config" / "routes"
-        search_roots = [
-            Path.cwd(),
-            AGENT_ROOT,
-            AGENT_ROOT / "config",
-            AGENT_ROOT / "config" / "routes",
-            repo_routes,
-        ]
-        if not path.is_absolute():
-            for root in search_roots:
-                candidate = root / path
-                if candidate.exists():
-                    return candidate
-            fallback = repo_routes / path.name
-            if fallback.exists():
-                return fallback
-
-        raise FileNotFoundError(f"Route file '{route_file}' was not found")
-
+        # ``AGENT_ROOT`` and the working directory are part of the cache key
+        # so a changed search root never serves a stale hit.
+        return _find_route_file(route_file, AGENT_ROOT, Path.cwd())
 
     @staticmethod
     def _infer_route_format(path: Path, data) -> str:
@@ -491,6 +857,12 @@ class PlanterSimulator(TelemetryPublisher):
     def _parse_route_geojson(self, data) -> List[_Point]:
         geometries = self._iter_geojson_geometries(data)
         points: List[_Point] = []
+        # ``_geodetic_to_enu`` inlined: whole lines are projected in one
+        # comprehension instead of a method call per coordinate.
+        base_lat = self.base_lat
+        base_lon = self.base_lon
+        east_m_per_deg = self._east_m_per_deg
+        north_m_per_deg = self._north_m_per_deg
         for geometry, active in geometries:
             coords_list = geometry.get("coordinates")
             geom_type = geometry.get("type")
@@ -501,12 +873,21 @@ class PlanterSimulator(TelemetryPublisher):
             else:
                 raise ValueError(f"Unsupported GeoJSON geometry: {geom_type}")
             for line in lines:
-                for coord in line:
-                    if len(coord) < 2:
-                        raise ValueError("GeoJSON coordinates must contain longitude and latitude")
-                    longitude, latitude = coord[:2]
-                    east, north = self._geodetic_to_enu(latitude, longitude)
-                    points.append(_Point(east_m=east, north_m=north, active=active))
+                try:
+                    points.extend(
+                        [
+                            _Point(
+                                (coord[0] - base_lon) * east_m_per_deg,
+                                (coord[1] - base_lat) * north_m_per_deg,
+                                active,
+                            )
+                            for coord in line
+                        ]
+                    )
+                except IndexError:
+                    raise ValueError(
+                        "GeoJSON coordinates must contain longitude and latitude"
+                    ) from None
         return points
 
     @staticmethod
@@ -559,107 +940,268 @@ class PlanterSimulator(TelemetryPublisher):
         raise TypeError(f"Unsupported route point representation: {entry!r}")
 
 
-class _PlanterWorker(threading.Thread):
-    """Background thread that streams planter telemetry for a session."""
+# Routes shipped in the source checkout.
+_REPO_ROUTES_DIR = Path(__file__).resolve().parents[2] / "config" / "routes"
 
-    daemon = True
 
-    def __init__(self, *, simulator: PlanterSimulator, session) -> None:
-        super().__init__(name=f"planter-sim-{id(session):x}")
-        self.simulator = simulator
-        self.session = session
-        self._stop_event = threading.Event()
-        self._cycle: Optional[List[_Sample]] = None
-        self._last_coordinate: Optional[Coordinate] = None
-        self._prev_displacement: Optional[Tuple[float, float]] = None
-        self._impl_theta: Optional[float] = None
-        self._last_forward: Optional[Tuple[float, float]] = None
-        self._last_right: Optional[Tuple[float, float]] = None
-        self._reset_articulation_state()
+@lru_cache(maxsize=64)
+def _find_route_file(route_file: str, agent_root: Path, cwd: Path) -> Path:
+    """Locate ``route_file``, resolving each distinct name only once.
 
-    def stop(self) -> None:
-        self._stop_event.set()
-
-    def _reset_articulation_state(self) -> None:
-        self._last_coordinate = None
-        self._prev_displacement = None
-        self._impl_theta = None
-        self._last_forward = None
-        self._last_right = None
-
-    def _compute_articulation(self, sample: _Sample) -> Optional[dict]:
-        if not self.simulator.is_articulated:
-            return None
-
-        coordinate = Coordinate(sample.point.east_m, sample.point.north_m)
-        last_coordinate = self._last_coordinate or coordinate
-        heading_rad = math.radians(sample.heading_deg)
-        fwd = (math.sin(heading_rad), math.cos(heading_rad))
-        right = (fwd[1], -fwd[0])
-
-        state = compute_articulated_centers(
-            last_xy=last_coordinate,
-            cur_xy=coordinate,
-            fwd=fwd,
-            right=right,
-            distancia_antena=self.simulator.antenna_to_articulation_m,
-            offset_longitudinal=self.simulator.offset_longitudinal_m,
-            offset_lateral=self.simulator.offset_lateral_m,
-            work_width_m=self.simulator.implement_width_m,
-            articulation_to_tool_m=self.simulator.articulation_to_tool_m,
-            impl_theta_rad=self._impl_theta,
-            tractor_heading_rad=heading_rad,
-            previous_displacement=self._prev_displacement,
-            last_fwd=self._last_forward,
-            last_right=self._last_right,
-        )
+    Failed lookups raise and are therefore not cached.
+    """
 
-        displacement = (coordinate.x - last_coordinate.x, coordinate.y - last_coordinate.y)
-        self._prev_displacement = displacement
-        self._impl_theta = state.theta
-        self._last_forward = fwd
-        self._last_right = right
-        self._last_coordinate = coordinate
+    path = Path(route_file)
+    if path.exists():
+        return path
+    if path.is_absolute():
+        raise FileNotFoundError(f"Route file '{route_file}' was not found")
 
-        joint_lat, joint_lon = self.simulator._enu_to_geodetic(
-            state.articulation_point.x, state.articulation_point.y
-        )
-        implement_lat, implement_lon = self.simulator._enu_to_geodetic(
-            state.current_center.x, state.current_center.y
+    search_roots = (
+        cwd,
+        agent_root,
+        agent_root / "config",
+        agent_root / "config" / "routes",
+        _REPO_ROUTES_DIR,
+    )
+    for refresh in (False, True):
+        if refresh:
+            # A file created after a directory was indexed: rescan once.
+            _route_index.cache_clear()
+        if len(path.parts) == 1:
+            for root in search_roots:
+                if path.name in _route_index(root):
+                    return root / path
+        else:
+            for root in search_roots:
+                candidate = root / path
+                if candidate.exists():
+                    return candidate
+        if path.name in _route_index(_REPO_ROUTES_DIR):
+            return _REPO_ROUTES_DIR / path.name
+
+    raise FileNotFoundError(f"Route file '{route_file}' was not found")
+
+
+@lru_cache(maxsize=16)
+def _route_index(directory: Path) -> frozenset:
+    """Names of the entries of ``directory``, listed with one ``scandir``."""
+
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _no_articulation(east: float, north: float, joint: None) -> Optional[dict]:
+    return None
+
+
+def _articulation_payload(east: float, north: float, joint: tuple) -> Optional[dict]:
+    """Pack one precomputed :class:`_ArticulationColumns` row for the payload."""
+
+    (
+        joint_x,
+        joint_y,
+        implement_x,
+        implement_y,
+        joint_lat,
+        joint_lon,
+        implement_lat,
+        implement_lon,
+        axis_x,
+        axis_y,
+        theta,
+        has_motion,
+    ) = joint
+    return {
+        "antenna_xy_m": [east, north],
+        "joint_xy_m": [joint_x, joint_y],
+        "implement_xy_m": [implement_x, implement_y],
+        "joint_latlon": [joint_lat, joint_lon],
+        "implement_latlon": [implement_lat, implement_lon],
+        "axis": [axis_x, axis_y],
+        "theta_rad": theta,
+        "has_motion": bool(has_motion),
+    }
+
+
+class _SessionStream:
+    """Streaming state of one session served by the :class:`_PlanterDispatcher`."""
+
+    __slots__ = (
+        "session",
+        "sequence",
+        "deadline",
+        "rows",
+        "pack_articulation",
+        "wall_offset",
+        "lag_reported",
+        "cancelled",
+    )
+
+    def __init__(self, session) -> None:
+        self.session = session
+        self.sequence = 1
+        self.deadline = 0.0  # monotonic time the next fix is due
+        # Wall clock minus monotonic clock, sampled once per cycle: fixes are
+        # stamped with their scheduled time instead of reading the clock.
+        self.wall_offset = 0.0
+        # Rows of the cycle being streamed; ``None`` between cycles.
+        self.rows: Optional[Iterator[tuple]] = None
+        self.pack_articulation: Callable[..., Optional[dict]] = _no_articulation
+        self.lag_reported = False
+        self.cancelled = False
+
+    def advance(self, simulator: PlanterSimulator) -> Optional[float]:
+        """Send the fix that is due; return when the next one is, ``None`` once done."""
+
+        if self.rows is None:
+            if not self.session.can_stream():
+                return _monotonic() + _STREAM_RETRY_S
+            cycle = simulator._shared_cycle()
+            if not cycle:
+                return None
+            self._start_cycle(cycle)
+        row = next(self.rows, None)
+        if row is None:
+            self.rows = None
+            return _monotonic() if simulator.loop_forever else None
+
+        (
+            east,
+            north,
+            latitude,
+            longitude,
+            active,
+            heading_deg,
+            speed_mps,
+            time_delta_s,
+        ), joint = row
+        message = simulator._build_message(
+            latitude,
+            longitude,
+            active,
+            heading_deg,
+            speed_mps,
+            self.sequence,
+            self.pack_articulation(east, north, joint),
+            self.wall_offset + self.deadline,
         )
+        if self.session.send_message(message):
+            self.sequence += 1
+        # Fixes are paced against absolute deadlines so the time spent
+        # building and sending each one does not accumulate as drift.
+        deadline = self.deadline + time_delta_s
+        now = _monotonic()
+        if deadline - now < -_MAX_SCHEDULE_LAG_S:
+            if not self.lag_reported:
+                LOGGER.warning(
+                    "planter simulator fell %.2fs behind schedule; resynchronising",
+                    now - deadline,
+                )
+                self.lag_reported = True
+            deadline = now
+        self.deadline = deadline
+        return deadline
+
+    def _start_cycle(self, cycle: _SampleColumns) -> None:
+        # The implement kind is fixed for the run, so pick the per-fix
+        # articulation packing once instead of branching on every fix.
+        articulation = cycle.articulation
+        if articulation is None:
+            self.rows = zip(cycle.rows(), repeat(None))
+            self.pack_articulation = _no_articulation
+        else:
+            self.rows = zip(cycle.rows(), articulation.rows())
+            self.pack_articulation = _articulation_payload
+        now = _monotonic()
+        self.deadline = now
+        self.wall_offset = time.time() - now
 
-        return {
-            "antenna_xy_m": [coordinate.x, coordinate.y],
-            "joint_xy_m": [state.articulation_point.x, state.articulation_point.y],
-            "implement_xy_m": [state.current_center.x, state.current_center.y],
-            "joint_latlon": [joint_lat, joint_lon],
-            "implement_latlon": [implement_lat, implement_lon],
-            "axis": [state.axis[0], state.axis[1]],
-            "theta_rad": state.theta,
-            "has_motion": state.significant_motion,
-        }
+
+class _PlanterDispatcher(threading.Thread):
+    """Single background thread streaming planter telemetry to every session.
+
+    All sessions stream the same shared cycle, so rather than a sleeping
+    thread each they wait in a heap ordered by the deadline of their next
+    fix.  The dispatcher sleeps until the earliest deadline, sends that fix
+    and pushes the session back with its following deadline.
+
+    Sending only queues the fix on the session's transport, which drops it
+    (without consuming a sequence number) while the monitor is not reading,
+    so one slow monitor never holds up the others.
+    """
+
+    daemon = True
+
+    def __init__(self, simulator: PlanterSimulator) -> None:
+        super().__init__(name="planter-sim")
+        self.simulator = simulator
+        self._queue: List[Tuple[float, int, _SessionStream]] = []
+        self._order = count()  # tie-breaker: streams do not compare
+        self._condition = threading.Condition()
+        self._stopped = False
+        # Held while a fix is built and queued, so ``cancel`` can wait for it.
+        self._send_lock = threading.Lock()
+
+    def add(self, stream: _SessionStream, deadline: float) -> None:
+        with self._condition:
+            heappush(self._queue, (deadline, next(self._order), stream))
+            if self._queue[0][2] is stream:
+                self._condition.notify()
+
+    def cancel(self, stream: _SessionStream) -> None:
+        """Stop streaming to ``stream``; returns once no fix is being sent to it."""
+
+        stream.cancelled = True  # its queue entry is dropped when popped
+        if threading.current_thread() is not self:
+            # Sends never wait on the transport, so this is short.
+            with self._send_lock:
+                pass
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._queue.clear()
+            self._condition.notify()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=_DISPATCHER_JOIN_TIMEOUT_S)
 
     def run(self) -> None:
-        sequence = 1
-        while not self._stop_event.is_set():
-            if not self.session.can_stream():
-                time.sleep(0.2)
-                continue
-            if self._cycle is None:
-                self._cycle = self.simulator._cycle_samples()
-                if not self._cycle:
-                    return
-            for sample in self._cycle:
-                if self._stop_event.is_set():
-                    break
-                articulation_payload = self._compute_articulation(sample)
-                message = self.simulator._build_message(sample, sequence, articulation_payload)
-                sent = self.session.send_message(message)
-                if sent:
-                    sequence += 1
-                time.sleep(sample.time_delta_s)
-            if self.simulator.loop_forever and not self._stop_event.is_set():
-                self._reset_articulation_state()
-            if not self.simulator.loop_forever:
-                break
-        self.simulator._on_worker_finished(self.session)
\ No newline at end of file
+        queue = self._queue
+        condition = self._condition
+        simulator = self.simulator
+        # The first build of the shared cycle takes a fraction of a second.
+        # Do it before serving any stream so it never runs under _send_lock,
+        # which ``cancel`` waits on; ``advance`` then only reads the cache.
+        try:
+            simulator._shared_cycle()
+        except Exception:  # pragma: no cover - defensive logging
+            LOGGER.exception("planter simulator failed to build its cycle")
+        while True:
+            with condition:
+                while True:
+                    if self._stopped:
+                        return
+                    if not queue:
+                        condition.wait()
+                        continue
+                    remaining = queue[0][0] - _monotonic()
+                    if remaining <= 0.0:
+                        break
+                    condition.wait(remaining)
+                _, _, stream = heappop(queue)
+            with self._send_lock:
+                if stream.cancelled:
+                    continue
+                try:
+                    deadline = stream.advance(simulator)
+                except Exception:  # pragma: no cover - defensive logging
+                    LOGGER.exception("planter simulator failed to stream to %r", stream.session)
+                    deadline = None
+            if deadline is None:
+                simulator._on_stream_finished(stream)
+            else:
+                self.add(stream, deadline)
@@ -1,10 +1,13 @@
 """Transport abstractions used by the gateway."""
 from __future__ import annotations
 
+import errno
 import logging
+import queue
+import selectors
 import socket
 import threading
-from typing import Callable
+from typing import Callable, Dict, List, Optional, Union
 
 from ..protocol.codec import LineCodec
 from ..protocol.messages import Message, error_message
@@ -12,6 +15,21 @@ from ..session import GatewaySession
 
 LOGGER = logging.getLogger(__name__)
 
+# Read size used for the monitor streams. Large reads amortise the syscall
+# cost over many newline-delimited messages (and over big UPDATE payloads).
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Upper bound on the buffers handed to a single ``sendmsg`` (Linux IOV_MAX).
+SEND_BATCH_MAX = 1024
+
+# Pushes from other threads (telemetry, simulated fixes) are dropped while
+# this many bytes are still waiting for a monitor that stopped reading.
+SEND_BACKLOG_MAX_BYTES = 256 * 1024
+
+# Errors meaning "try again later" on a non-blocking stream.  PyBluez wraps
+# them in BluetoothError, so they are matched by errno rather than by type.
+_RETRY_ERRNOS = frozenset({errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR})
+
 
 class TransportServer:
     """Base class for concrete transports (TCP, Bluetooth, ...)."""
@@ -23,10 +41,13 @@ class TransportServer:
         raise NotImplementedError
 
 
-class StreamWorker(threading.Thread):
-    """Thread that handles a single duplex byte stream."""
+class StreamConnection:
+    """State for a single duplex byte stream served by a :class:`StreamReactor`.
 
-    daemon = True
+    The socket is expected to be non-blocking.  Outgoing lines are queued and
+    written by :meth:`flush`, which never waits for the peer: whatever the
+    kernel does not accept stays queued until the stream becomes writable.
+    """
 
     def __init__(
         self,
@@ -34,63 +55,399 @@ class StreamWorker(threading.Thread):
         conn: socket.socket,
         peer: str,
         session_factory: Callable[[], GatewaySession],
+        schedule_flush: Optional[Callable[["StreamConnection"], None]] = None,
     ) -> None:
-        super().__init__(name=f"{peer}-worker")
         self.conn = conn
         self.peer = peer
-        self.session_factory = session_factory
+        self.fileno = conn.fileno()
+        self.events = selectors.EVENT_READ
+        # Called when lines are queued from another thread while no flush is
+        # pending; without a reactor the sending thread flushes itself.
+        self._schedule_flush = schedule_flush or StreamConnection.flush
         self._send_lock = threading.Lock()
-
-    def run(self) -> None:  # pragma: no cover - network IO
-        LOGGER.info("connection opened from %s", self.peer)
-        session = self.session_factory()
-        attach = getattr(session, "attach_sender", None)
+        # Encoded lines queued since the last flush (guarded by _send_lock).
+        self._pending: List[bytes] = []
+        # Bytes queued but not yet accepted by the kernel.
+        self._backlog = 0
+        self._flush_scheduled = False
+        self._blocked = False  # the last flush left data behind
+        self._dropping = False
+        # While a read is handled, lines pushed by other threads wait here so
+        # they follow the replies to that read (e.g. an UPDATE outcome pushed
+        # by the worker before its ACK was queued).
+        self._reading = False
+        self._held: List[bytes] = []
+        # Lines handed to the writer but not (fully) sent; flush() only.
+        self._unsent: List[Union[bytes, memoryview]] = []
+        self._buffer = bytearray()
+        self._start = 0  # offset of the first byte not yet consumed
+        self.session = session_factory()
+        attach = getattr(self.session, "attach_sender", None)
         if attach:
             attach(self._send)
+
+    @property
+    def backlog(self) -> int:
+        """Number of queued bytes the peer has not taken yet."""
+
+        return self._backlog
+
+    def on_readable(self) -> bool:
+        """Consume the available bytes; return ``False`` once the peer is gone.
+
+        Replies are only queued; the reactor flushes them afterwards.
+        """
+
         try:
-            buffer = b""
-            while True:
-                chunk = self.conn.recv(4096)
-                if not chunk:
-                    break
-                buffer += chunk
-                while b"\n" in buffer:
-                    line, buffer = buffer.split(b"\n", 1)
-                    if not line:
-                        continue
-                    try:
-                        message = LineCodec.decode(line)
-                    except Exception as exc:
-                        LOGGER.warning("failed to decode message from %s: %s", self.peer, exc)
-                        self.conn.sendall(
-                            LineCodec.encode(
-                                error_message(
-                                    "invalid message format",
-                                    code="bad_json",
-                                    details={"error": str(exc)},
-                                )
-                            )
-                        )
-                        continue
-                    for response in session.handle_message(message):
-                        self._send(response)
+            chunk = self.conn.recv(RECV_BUFFER_SIZE)
+        except OSError as exc:
+            if exc.errno in _RETRY_ERRNOS:
+                return True
+            raise
+        if not chunk:
+            return False
+        buffer = self._buffer
+        # Only scan the freshly received bytes: a large UPDATE line arriving
+        # over many reads is appended, never re-copied.
+        newline = chunk.find(b"\n")
+        scan_from = len(buffer)
+        buffer += chunk
+        if newline == -1:
+            return True
+        newline += scan_from
+        start = self._start
+        # Replies to every line received in this wakeup leave in one batch.
+        replies: List[bytes] = []
+        with self._send_lock:
+            self._reading = True
+        try:
+            while newline != -1:
+                line = buffer[start:newline]
+                start = newline + 1
+                if line:
+                    self._handle_line(line, replies)
+                newline = buffer.find(b"\n", start)
+        finally:
+            with self._send_lock:
+                self._reading = False
+                self._pending.extend(replies)
+                self._backlog += sum(map(len, replies))
+                if self._held:
+                    self._pending.extend(self._held)
+                    self._held.clear()
+        if start == len(buffer):
+            buffer.clear()
+            start = 0
+        elif start > len(buffer) // 2:
+            # Compact only once the consumed prefix dominates so the total
+            # number of bytes moved stays linear.
+            del buffer[:start]
+            start = 0
+        self._start = start
+        return True
+
+    def flush(self) -> bool:
+        """Write queued lines without blocking; return ``True`` once all are sent.
+
+        Lines queued by other threads while the flush runs are written by it
+        too, so at most one flush is in progress per connection.
+        """
+
+        unsent = self._unsent
+        written = 0
+        while True:
+            with self._send_lock:
+                self._backlog -= written
+                if self._pending:
+                    unsent.extend(self._pending)
+                    self._pending.clear()
+                if not unsent:
+                    self._flush_scheduled = False
+                    self._blocked = False
+                    self._dropping = False
+                    return True
+            written = self._write(unsent)
+            if unsent:
+                # The socket buffer is full; wait for the stream to drain.
+                with self._send_lock:
+                    self._backlog -= written
+                    self._flush_scheduled = False
+                    self._blocked = True
+                return False
+
+    def close(self) -> None:
+        try:
+            self.session.close()
+        except Exception:  # pragma: no cover - defensive cleanup
+            LOGGER.exception("error closing session for %s", self.peer)
         finally:
             try:
-                session.close()
-            except Exception:  # pragma: no cover - defensive cleanup
-                LOGGER.exception("error closing session for %s", self.peer)
+                self.conn.close()
             finally:
-                try:
-                    self.conn.close()
-                finally:
-                    LOGGER.info("connection closed from %s", self.peer)
+                LOGGER.info("connection closed from %s", self.peer)
+
+    def _handle_line(self, line: bytearray, replies: List[bytes]) -> None:
+        try:
+            message = LineCodec.decode(line)
+        except Exception as exc:
+            LOGGER.warning("failed to decode message from %s: %s", self.peer, exc)
+            replies.append(
+                LineCodec.encode(
+                    error_message(
+                        "invalid message format",
+                        code="bad_json",
+                        details={"error": str(exc)},
+                    )
+                )
+            )
+            return
+        for response in self.session.handle_message(message):
+            replies.append(LineCodec.encode(response))
+
+    def _send(self, message: Message) -> bool:
+        """Queue ``message`` from any thread; return ``False`` if it was dropped."""
 
-    def _send(self, message: Message) -> None:
-        data = LineCodec.encode(message)
+        line = LineCodec.encode(message)
         with self._send_lock:
-            self.conn.sendall(data)
+            if self._backlog >= SEND_BACKLOG_MAX_BYTES:
+                if not self._dropping:
+                    self._dropping = True
+                    LOGGER.warning(
+                        "%s is not reading; dropping pushed messages", self.peer
+                    )
+                return False
+            self._backlog += len(line)
+            if self._reading:
+                # Flushed with the replies once the read has been handled.
+                self._held.append(line)
+                return True
+            self._pending.append(line)
+            wake = not (self._flush_scheduled or self._blocked)
+            if wake:
+                self._flush_scheduled = True
+        if wake:
+            self._schedule_flush(self)
+        return True
+
+    def _write(self, buffers: List[Union[bytes, memoryview]]) -> int:
+        """Send from the head of ``buffers`` until the socket would block.
+
+        Buffers written in full are removed and a partially written one is
+        trimmed in place; the number of bytes sent is returned.
+        """
+
+        conn = self.conn
+        sendmsg = getattr(conn, "sendmsg", None)
+        if sendmsg is None and len(buffers) > 1:
+            # RFCOMM sockets from PyBluez have no sendmsg.
+            buffers[:] = [b"".join(buffers)]
+        total = 0
+        while buffers:
+            try:
+                if sendmsg is None or len(buffers) == 1:
+                    sent = conn.send(buffers[0])
+                else:
+                    sent = sendmsg(buffers[:SEND_BATCH_MAX])
+            except OSError as exc:
+                if exc.errno in _RETRY_ERRNOS:
+                    break
+                raise
+            if not sent:
+                break
+            total += sent
+            # Drop the buffers written in full and trim a partial one.
+            index = 0
+            while index < len(buffers) and sent >= len(buffers[index]):
+                sent -= len(buffers[index])
+                index += 1
+            del buffers[:index]
+            if sent:
+                buffers[0] = memoryview(buffers[0])[sent:]
+        return total
+
+
+class StreamReactor(threading.Thread):
+    """Serve every monitor stream from one thread using :mod:`selectors`.
+
+    Listening sockets and client streams (TCP or RFCOMM, anything exposing
+    ``fileno``) are multiplexed by a single selector, so idle connections
+    cost neither a thread nor its stack.  Registration requests coming from
+    other threads are queued and picked up after waking the selector.
+
+    Client streams must be non-blocking and are only ever written from this
+    thread: a monitor that stops reading keeps its unsent lines queued (and
+    ``EVENT_WRITE`` armed) instead of stalling every other stream.
+    """
+
+    daemon = True
+
+    def __init__(self, name: str = "stream-reactor") -> None:
+        super().__init__(name=name)
+        self._selector = selectors.DefaultSelector()
+        self._calls: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._wakeup_reader, self._wakeup_writer = socket.socketpair()
+        self._wakeup_reader.setblocking(False)
+        self._wakeup_writer.setblocking(False)
+        # Selector callbacks receive the ready event mask.
+        self._selector.register(self._wakeup_reader, selectors.EVENT_READ, self._drain_wakeup)
+        self._connections: Dict[int, StreamConnection] = {}
+        self._stop_event = threading.Event()
+        self._start_lock = threading.Lock()
+        self._start_requested = False
+
+    # Public API -----------------------------------------------------------
+    def start(self) -> None:
+        """Start the reactor thread; calling it again is a no-op."""
+
+        with self._start_lock:
+            if self._start_requested:
+                return
+            self._start_requested = True
+        super().start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wakeup()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=5.0)
+
+    def add_listener(self, sock: socket.socket, on_accept: Callable[[], None]) -> None:
+        """Call ``on_accept`` from the reactor thread whenever ``sock`` is readable."""
+
+        self.call_soon(
+            lambda: self._selector.register(sock, selectors.EVENT_READ, lambda _mask: on_accept())
+        )
 
+    def remove_listener(self, sock: socket.socket) -> None:
+        self.call_soon(lambda: self._unregister(sock))
 
+    def call_soon(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` on the reactor thread."""
+
+        self._calls.put(callback)
+        self._wakeup()
+
+    def add_connection(
+        self,
+        conn: socket.socket,
+        peer: str,
+        session_factory: Callable[[], GatewaySession],
+    ) -> None:
+        """Serve ``conn`` until the peer disconnects or the reactor stops."""
+
+        self.call_soon(lambda: self._open_connection(conn, peer, session_factory))
+
+    # Reactor loop ---------------------------------------------------------
+    def run(self) -> None:
+        try:
+            while not self._stop_event.is_set():
+                for key, mask in self._selector.select(timeout=1.0):
+                    try:
+                        key.data(mask)
+                    except Exception:  # pragma: no cover - defensive logging
+                        LOGGER.exception("stream reactor callback failed")
+        finally:
+            for connection in list(self._connections.values()):
+                self._close_connection(connection)
+            for key in list(self._selector.get_map().values()):
+                self._unregister(key.fileobj)
+            self._selector.close()
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+
+    def _wakeup(self) -> None:
+        try:
+            self._wakeup_writer.send(b"\0")
+        except (BlockingIOError, OSError):
+            # Buffer full (a wakeup is already pending) or reactor stopped.
+            pass
+
+    def _drain_wakeup(self, _mask: int) -> None:
+        try:
+            while self._wakeup_reader.recv(4096):
+                pass
+        except BlockingIOError:
+            pass
+        while True:
+            try:
+                callback = self._calls.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception:  # pragma: no cover - defensive logging
+                LOGGER.exception("stream reactor callback failed")
+
+    def _open_connection(
+        self,
+        conn: socket.socket,
+        peer: str,
+        session_factory: Callable[[], GatewaySession],
+    ) -> None:
+        LOGGER.info("connection opened from %s", peer)
+        connection = StreamConnection(
+            conn=conn,
+            peer=peer,
+            session_factory=session_factory,
+            schedule_flush=self._schedule_flush,
+        )
+        self._connections[connection.fileno] = connection
+        self._selector.register(
+            conn, connection.events, lambda mask: self._on_connection_event(connection, mask)
+        )
+
+    def _on_connection_event(self, connection: StreamConnection, mask: int) -> None:
+        if mask & selectors.EVENT_READ:
+            try:
+                alive = connection.on_readable()
+            except OSError as exc:
+                LOGGER.warning("stream error from %s: %s", connection.peer, exc)
+                alive = False
+            except Exception:
+                LOGGER.exception("error serving %s", connection.peer)
+                alive = False
+            if not alive:
+                self._close_connection(connection)
+                return
+        self._flush_connection(connection)
+
+    def _schedule_flush(self, connection: StreamConnection) -> None:
+        self.call_soon(lambda: self._flush_connection(connection))
+
+    def _flush_connection(self, connection: StreamConnection) -> None:
+        if self._connections.get(connection.fileno) is not connection:
+            return  # closed before the flush ran
+        try:
+            drained = connection.flush()
+        except OSError as exc:
+            LOGGER.warning("stream error from %s: %s", connection.peer, exc)
+            self._close_connection(connection)
+            return
+        events = selectors.EVENT_READ
+        if not drained:
+            events |= selectors.EVENT_WRITE
+        if events != connection.events:
+            connection.events = events
+            key = self._selector.get_key(connection.conn)
+            self._selector.modify(connection.conn, events, key.data)
+
+    def _close_connection(self, connection: StreamConnection) -> None:
+        self._connections.pop(connection.fileno, None)
+        self._unregister(connection.conn)
+        connection.close()
+
+    def _unregister(self, fileobj) -> None:
+        try:
+            self._selector.unregister(fileobj)
+        except (KeyError, ValueError):
+            pass
 
 
-__all__ = ["TransportServer", "StreamWorker"]
\ No newline at end of file
+__all__ = [
+    "TransportServer",
+    "StreamConnection",
+    "StreamReactor",
+    "RECV_BUFFER_SIZE",
+    "SEND_BATCH_MAX",
+    "SEND_BACKLOG_MAX_BYTES",
+]
@@ -29,7 +29,7 @@ except Exception:  # pragma: no cover - optional dependency
     BluetoothError = Exception  # type: ignore[assignment]
     BLUETOOTH_AVAILABLE = False
 
-from .base import StreamWorker, TransportServer
+from .base import StreamReactor, TransportServer
 from ..config import AgentConfig
 from ..session import GatewaySession
 
@@ -38,11 +38,16 @@ LOGGER = logging.getLogger("ma_agent.transport.bluetooth")
 
 class BluetoothServer(TransportServer):
     def __init__(
-        self, config: AgentConfig, session_factory: Callable[[], GatewaySession]
+        self,
+        config: AgentConfig,
+        session_factory: Callable[[], GatewaySession],
+        *,
+        reactor: StreamReactor | None = None,
     ) -> None:
         super().__init__("bluetooth")
         self.config = config
         self._session_factory = session_factory
+        self._reactor = reactor or StreamReactor(name="bt-reactor")
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
         self._server_socket: BluetoothSocket | None = None  # type: ignore[assignment]
@@ -56,6 +61,7 @@ class BluetoothServer(TransportServer):
             return
 
         self._stop_event.clear()
+        self._reactor.start()
         self._thread = threading.Thread(target=self._run, name="bt-server", daemon=True)
         self._thread.start()
 
@@ -125,13 +131,7 @@ class BluetoothServer(TransportServer):
                     continue
 
                 LOGGER.info("accepted bluetooth connection from %s", client_info)
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_sock, client_info),
-                    name=self._client_thread_name(client_info),
-                    daemon=True,
-                )
-                client_thread.start()
+                self._handle_client(client_sock, client_info)
 
         except BluetoothError as exc:  # type: ignore[misc]
             if not self._stop_event.is_set():
@@ -151,24 +151,18 @@ class BluetoothServer(TransportServer):
     def _handle_client(self, client_sock, client_info) -> None:  # pragma: no cover - hardware interaction
         peer = self._format_peer(client_info)
         try:
-            worker = StreamWorker(
-                conn=client_sock,
-                peer=peer,
-                session_factory=self._session_factory,
-            )
-            worker.run()
+            # The accepted socket may inherit the listening timeout; the
+            # reactor needs a non-blocking stream so a stalled link cannot
+            # hold up the other monitors.
+            client_sock.setblocking(False)
+            self._reactor.add_connection(client_sock, peer, self._session_factory)
         except Exception as exc:
             LOGGER.warning("bluetooth client handler error for %s: %s", peer, exc)
-        finally:
             try:
                 client_sock.close()
             except Exception:
                 pass
 
-    def _client_thread_name(self, client_info) -> str:
-        peer = self._format_peer(client_info)
-        return f"bt-client-{peer.split(':', 1)[-1]}"
-
     @staticmethod
     def _format_peer(client_info) -> str:
         if isinstance(client_info, (list, tuple)) and client_info:
@@ -3,42 +3,87 @@ from __future__ import annotations
 
 import logging
 import socket
-import threading
 
-from .base import StreamWorker, TransportServer
+from .base import StreamReactor, TransportServer
 from ..config import AgentConfig
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TcpServer(TransportServer):
-    def __init__(self, config: AgentConfig, session_factory):
+    def __init__(self, config: AgentConfig, session_factory, *, reactor: StreamReactor | None = None):
         super().__init__("tcp")
         self.config = config
         self._session_factory = session_factory
-        self._thread: threading.Thread | None = None
+        self._reactor = reactor or StreamReactor(name="tcp-reactor")
+        self._server_socket: socket.socket | None = None
 
     def start(self) -> None:  # pragma: no cover - network IO
-        if self._thread and self._thread.is_alive():
+        if self._server_socket is not None:
             return
 
-        def _run() -> None:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server:
-                server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                server.bind((self.config.tcp_host, self.config.tcp_port))
-                server.listen(5)
-                LOGGER.info("TCP listening on %s:%s", self.config.tcp_host, self.config.tcp_port)
-                while True:
-                    conn, addr = server.accept()
-                    worker = StreamWorker(
-                        conn=conn,
-                        peer=f"tcp:{addr[0]}:{addr[1]}",
-                        session_factory=self._session_factory,
-                    )
-                    worker.start()
-
-        self._thread = threading.Thread(target=_run, name="tcp-server", daemon=True)
-        self._thread.start()
-
-
-__all__ = ["TcpServer"]
\ No newline at end of file
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            server.bind((self.config.tcp_host, self.config.tcp_port))
+            server.listen(self.config.tcp_backlog)
+            server.setblocking(False)
+        except OSError:
+            server.close()
+            LOGGER.exception(
+                "failed to listen on %s:%s", self.config.tcp_host, self.config.tcp_port
+            )
+            return
+
+        self._server_socket = server
+        self._reactor.start()
+        self._reactor.add_listener(server, self._accept)
+        LOGGER.info("TCP listening on %s:%s", self.config.tcp_host, self.config.tcp_port)
+
+    def stop(self) -> None:  # pragma: no cover - network IO
+        server, self._server_socket = self._server_socket, None
+        if server is None:
+            return
+        self._reactor.remove_listener(server)
+        self._reactor.call_soon(server.close)
+
+    def _accept(self) -> None:  # pragma: no cover - network IO
+        server = self._server_socket
+        if server is None:
+            return
+        try:
+            conn, addr = server.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as exc:
+            LOGGER.warning("TCP accept failed: %s", exc)
+            return
+        # The reactor never waits on a client: reads follow a readiness event
+        # and writes stop when the send buffer is full.
+        conn.setblocking(False)
+        self._configure_client_socket(conn)
+        self._reactor.add_connection(conn, f"tcp:{addr[0]}:{addr[1]}", self._session_factory)
+
+    def _configure_client_socket(self, conn: socket.socket) -> None:
+        """Tune an accepted socket for small, latency sensitive messages.
+
+        Nagle is disabled so replies are not held back waiting for more data
+        and the kernel buffers are enlarged for bulk UPDATE transfers.  The
+        kernel silently caps the buffers at ``net.core.rmem_max``/``wmem_max``.
+        """
+
+        try:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self.config.tcp_recv_buffer_bytes > 0:
+                conn.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_RCVBUF, self.config.tcp_recv_buffer_bytes
+                )
+            if self.config.tcp_send_buffer_bytes > 0:
+                conn.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_SNDBUF, self.config.tcp_send_buffer_bytes
+                )
+        except OSError as exc:  # pragma: no cover - platform specific
+            LOGGER.warning("failed to tune TCP socket options: %s", exc)
+
+
+__all__ = ["TcpServer"]
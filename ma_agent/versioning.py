@@ -1,12 +1,20 @@
 """Utilities for dealing with the agent version."""
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from .paths import VERSION_FILE
 
 
+@lru_cache(maxsize=8)
 def read_version(version_file: Path | None = None) -> str:
+    """Return the installed agent version.
+
+    The result is cached per file; call ``read_version.cache_clear()`` after
+    replacing ``VERSION.txt`` (e.g. when an update is applied).
+    """
+
     target = version_file or VERSION_FILE
     try:
         return target.read_text(encoding="utf-8").strip()
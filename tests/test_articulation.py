@@ -0,0 +1,166 @@
+import math
+
+import pytest
+
+from ma_agent.articulation import (
+    ArticulationGeometry,
+    ArticulationTrack,
+    Coordinate,
+    compute_articulated_centers,
+    compute_articulated_track,
+    compute_rigid_center,
+    fill_articulation_track,
+)
+
+GEOMETRY = dict(
+    distancia_antena=1.5,
+    offset_longitudinal=0.3,
+    offset_lateral=-0.2,
+    work_width_m=13.0,
+    articulation_to_tool_m=4.0,
+)
+
+
+def _curved_path(count: int = 60):
+    positions = []
+    headings = []
+    for index in range(count):
+        # Hold still for a few samples to exercise the stationary branch.
+        angle = min(index, 20) * 0.04 if index < 25 else (index - 5) * 0.04
+        positions.append((20.0 * math.sin(angle), 20.0 * (1.0 - math.cos(angle))))
+        headings.append(math.atan2(math.cos(angle), math.sin(angle)))
+    return positions, headings
+
+
+def test_track_matches_step_by_step_calls():
+    positions, headings = _curved_path()
+
+    track = compute_articulated_track(positions, headings, **GEOMETRY)
+
+    last_xy = None
+    last_fwd = last_right = previous = theta = None
+    for (x, y), heading, batched in zip(positions, headings, track):
+        cur_xy = Coordinate(x, y)
+        fwd = (math.sin(heading), math.cos(heading))
+        right = (fwd[1], -fwd[0])
+        reference = last_xy or cur_xy
+        state = compute_articulated_centers(
+            reference,
+            cur_xy,
+            fwd=fwd,
+            right=right,
+            impl_theta_rad=theta,
+            tractor_heading_rad=heading,
+            previous_displacement=previous,
+            last_fwd=last_fwd,
+            last_right=last_right,
+            **GEOMETRY,
+        )
+        assert batched == state
+        previous = cur_xy.delta(reference)
+        theta, last_fwd, last_right, last_xy = state.theta, fwd, right, cur_xy
+
+    assert len(track) == len(positions)
+
+
+def test_track_keeps_implement_geometry():
+    positions, headings = _curved_path()
+
+    for state in compute_articulated_track(positions, headings, **GEOMETRY):
+        assert math.hypot(*state.axis) == pytest.approx(1.0)
+        tool_distance = state.current_center.distance_to(state.articulation_point)
+        assert tool_distance == pytest.approx(GEOMETRY["articulation_to_tool_m"])
+
+
+def test_track_buffer_keeps_most_recent_states_by_column():
+    positions, headings = _curved_path()
+    states = compute_articulated_track(positions, headings, **GEOMETRY)
+    buffer = ArticulationTrack(capacity=16)
+
+    buffer.extend(states)
+
+    assert len(buffer) == 16
+    assert [buffer.state(index) for index in range(16)] == states[-16:]
+    columns = buffer.columns()
+    assert list(columns["theta"]) == [state.theta for state in states[-16:]]
+    assert list(columns["significant_motion"]) == [
+        state.significant_motion for state in states[-16:]
+    ]
+
+
+def test_centers_axis_is_unit_and_perpendicular_to_the_drawbar():
+    heading = math.radians(30.0)
+    fwd = (math.sin(heading), math.cos(heading))
+    right = (fwd[1], -fwd[0])
+
+    state = compute_articulated_centers(
+        Coordinate(0.0, 0.0),
+        Coordinate(0.5, 0.8),
+        fwd=fwd,
+        right=right,
+        impl_theta_rad=math.radians(10.0),
+        tractor_heading_rad=heading,
+        **GEOMETRY,
+    )
+
+    drawbar = state.current_center.delta(state.articulation_point)
+    assert math.hypot(*state.axis) == pytest.approx(1.0)
+    assert drawbar[0] * state.axis[0] + drawbar[1] * state.axis[1] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_centers_reuse_previous_axis_without_changing_the_result():
+    positions, headings = _curved_path(12)
+    previous = None
+    for index in range(1, len(positions)):
+        heading = headings[index]
+        fwd = (math.sin(heading), math.cos(heading))
+        right = (fwd[1], -fwd[0])
+        common = dict(
+            fwd=fwd,
+            right=right,
+            impl_theta_rad=previous.theta if previous else None,
+            tractor_heading_rad=heading,
+            **GEOMETRY,
+        )
+        last_xy = Coordinate(*positions[index - 1])
+        cur_xy = Coordinate(*positions[index])
+
+        state = compute_articulated_centers(last_xy, cur_xy, **common)
+        reused = compute_articulated_centers(
+            last_xy, cur_xy, last_axis=previous.axis if previous else None, **common
+        )
+
+        assert reused == state
+        previous = state
+
+
+def test_rigid_center_matches_the_articulation_point():
+    heading = math.radians(45.0)
+    fwd = (math.sin(heading), math.cos(heading))
+    right = (fwd[1], -fwd[0])
+    cur_xy = Coordinate(3.0, 4.0)
+
+    state = compute_articulated_centers(
+        cur_xy, cur_xy, fwd=fwd, right=right, impl_theta_rad=None, **GEOMETRY
+    )
+    center = compute_rigid_center(
+        cur_xy,
+        fwd=fwd,
+        right=right,
+        long_offset=GEOMETRY["distancia_antena"] + GEOMETRY["offset_longitudinal"],
+        offset_lateral=GEOMETRY["offset_lateral"],
+    )
+
+    assert center == state.articulation_point
+
+
+def test_fill_track_stores_the_same_samples_as_the_state_replay():
+    positions, headings = _curved_path()
+    states = compute_articulated_track(positions, headings, **GEOMETRY)
+    geometry = ArticulationGeometry.from_offsets(**GEOMETRY)
+
+    track = fill_articulation_track(
+        ArticulationTrack(capacity=len(states)), positions, headings, geometry
+    )
+
+    assert [track.state(index) for index in range(len(track))] == states
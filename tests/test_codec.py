@@ -0,0 +1,94 @@
+import importlib.util
+import json
+import sys
+
+import pytest
+
+from ma_agent.protocol import codec as codec_module
+from ma_agent.protocol.codec import LineCodec
+from ma_agent.protocol.messages import Message, MessageType, gnss_fix_message
+
+
+def test_encode_matches_the_json_envelope():
+    message = gnss_fix_message(
+        latitude=-22.5, longitude=-47.25, altitude=550.0, sequence=7, rtk_state="FIXED"
+    )
+
+    line = LineCodec.encode(message)
+
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == message.to_dict()
+
+
+def test_gnss_fix_payload_keeps_field_order():
+    full = gnss_fix_message(
+        latitude=1.0,
+        longitude=2.0,
+        altitude=3.0,
+        accuracy=0.02,
+        sequence=4,
+        timestamp=5.0,
+        rtk_state="FIXED",
+    )
+    partial = gnss_fix_message(latitude=1.0, longitude=2.0, altitude=3.0, sequence=4)
+
+    assert list(full.payload) == [
+        "latitude",
+        "longitude",
+        "altitude",
+        "accuracy",
+        "sequence",
+        "timestamp",
+        "rtk_state",
+    ]
+    assert list(partial.payload) == ["latitude", "longitude", "altitude", "sequence"]
+
+
+def test_round_trip_for_every_message_type():
+    for message_type in MessageType:
+        for payload in ({}, {"value": 1, "nested": {"items": [1.5, "x"]}}):
+            message = Message(type=message_type, payload=payload)
+            assert LineCodec.decode(LineCodec.encode(message)) == message
+
+
+def test_decode_rejects_unknown_or_malformed_types():
+    for line in (b'{"type":"NOPE"}', b'{"type":["PING"]}', b'{"payload":{}}'):
+        try:
+            LineCodec.decode(line)
+        except ValueError as exc:
+            assert "unknown message type" in str(exc)
+        else:  # pragma: no cover - assertion helper
+            raise AssertionError(f"{line!r} should be rejected")
+
+
+@pytest.fixture
+def stdlib_codec(monkeypatch):
+    """A copy of the codec module imported as if orjson were not installed."""
+
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.spec_from_file_location(
+        "ma_agent.protocol._codec_without_orjson", codec_module.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.ORJSON_AVAILABLE is False
+    return module
+
+
+def test_stdlib_fallback_round_trips_every_message_type(stdlib_codec):
+    for message_type in MessageType:
+        for payload in ({}, {"value": 1, "nested": {"items": [1.5, "x"]}}):
+            message = Message(type=message_type, payload=payload)
+            line = stdlib_codec.LineCodec.encode(message)
+            assert line == LineCodec.encode(message)
+            assert stdlib_codec.LineCodec.decode(line) == message
+
+
+def test_non_string_keys_encode_like_json_dumps(stdlib_codec):
+    message = Message(
+        type=MessageType.STATUS_RESPONSE, payload={"counts": {1: "a", None: "b", 2.5: "c"}}
+    )
+
+    expected = {"counts": {"1": "a", "null": "b", "2.5": "c"}}
+    for codec in (LineCodec, stdlib_codec.LineCodec):
+        assert json.loads(codec.encode(message))["payload"] == expected
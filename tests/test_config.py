@@ -0,0 +1,24 @@
+import dataclasses
+
+import pytest
+
+from ma_agent.config import AgentConfig
+
+
+def test_from_env_reads_the_current_environment(monkeypatch):
+    monkeypatch.setenv("MA_AGENT_TCP_PORT", "9000")
+    assert AgentConfig.from_env().tcp_port == 9000
+
+    monkeypatch.setenv("MA_AGENT_TCP_PORT", "9001")
+    monkeypatch.setenv("MA_AGENT_ENABLE_BT", "false")
+    config = AgentConfig.from_env()
+
+    assert config.tcp_port == 9001
+    assert config.enable_bluetooth is False
+
+
+def test_config_is_read_only():
+    config = AgentConfig()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.tcp_port = 1  # type: ignore[misc]
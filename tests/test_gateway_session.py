@@ -63,6 +63,28 @@ def test_hello_registers_session_and_advertises_capabilities(hello_message):
     assert session.telemetry_subscribed is True
 
 
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        ({}, True),
+        ({"subscribe": True}, True),
+        ({"subscriptions": False}, False),
+        ({"subscribe": ["telemetry/basic"]}, False),
+        ({"subscribe": ["telemetry"]}, True),
+        ({"subscribe": [{"topic": "telemetry"}]}, False),
+        ({"subscribe": {"telemetry": {"rtk": False}}}, False),
+        ({"subscribe": {"telemetry/rtk": True}}, True),
+        ({"subscribe": "telemetry"}, True),
+    ],
+)
+def test_hello_subscription_forms(payload, expected):
+    session = GatewaySession()
+
+    session.handle_message(Message(type=MessageType.HELLO, payload=payload))
+
+    assert session.telemetry_subscribed is expected
+
+
 def test_close_unregisters_dependencies(hello_message):
     publisher = FakeTelemetryPublisher()
     coordinator = FakeGnssCoordinator()
@@ -78,6 +100,28 @@ def test_close_unregisters_dependencies(hello_message):
     assert coordinator.unregistered == [session]
 
 
+def test_subclass_handler_overrides_are_dispatched(hello_message):
+    class _Session(GatewaySession):
+        def _on_ping(self, message):
+            return [Message(type=MessageType.ACK, payload={"action": "PING"})]
+
+    class _Nested(_Session):
+        def _on_hello(self, message):
+            self.greeted = True
+            return super()._on_hello(message)
+
+    session = _Nested()
+    session.handle_message(hello_message)
+    [reply] = session.handle_message(Message(type=MessageType.PING, payload={}))
+    base = GatewaySession()
+    base.handle_message(hello_message)
+    [pong] = base.handle_message(Message(type=MessageType.PING, payload={}))
+
+    assert session.greeted is True
+    assert reply.payload == {"action": "PING"}
+    assert pong.type is MessageType.PONG
+
+
 def test_info_includes_articulated_implement_details(hello_message):
     profile = load_implement_profile()
     session = GatewaySession(implement_profile=profile)
@@ -94,6 +138,23 @@ def test_info_includes_articulated_implement_details(hello_message):
         profile.articulation_to_tool_m
     )
 
+
+def test_info_implement_payload_cannot_be_corrupted(hello_message):
+    import dataclasses
+
+    profile = load_implement_profile()
+    session = GatewaySession(implement_profile=profile)
+    session.handle_message(hello_message)
+
+    [first] = session.handle_message(Message(type=MessageType.INFO, payload={}))
+    first.payload["implement"]["name"] = "changed"
+    first.payload["implement"]["sections"][0]["count"] = -1
+    [second] = session.handle_message(Message(type=MessageType.INFO, payload={}))
+
+    assert second.payload["implement"] == profile._build_payload()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        profile.name = "changed"  # type: ignore[misc]
+
 def test_gnss_ack_updates_state(hello_message):
     clock_values = [100.0, 200.0]
 
@@ -217,4 +278,105 @@ def test_send_message_marks_fix_when_ready(hello_message):
 
     assert session.send_message(message) is True
     assert captured == [message]
-    assert session.awaiting_ack is True
\ No newline at end of file
+    assert session.awaiting_ack is True
+
+def _update_session(tmp_path, monkeypatch):
+    import queue
+
+    from ma_agent import session as session_module
+
+    launched = []
+    monkeypatch.setattr(session_module, "UPDATES_DIR", tmp_path / "updates")
+    monkeypatch.setattr(session_module, "AGENT_ROOT", tmp_path / "root")
+    monkeypatch.setattr(session_module.subprocess, "Popen", lambda *a, **kw: launched.append(a))
+    session = GatewaySession()
+    notifications = queue.Queue()
+    session.attach_sender(notifications.put)
+    session.handle_message(Message(type=MessageType.HELLO, payload={}))
+    return session, launched, notifications
+
+
+def test_update_streams_package_and_extracts(tmp_path, monkeypatch):
+    import io
+    import zipfile
+
+    session, launched, notifications = _update_session(tmp_path, monkeypatch)
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("VERSION.txt", "9.9.9\n")
+        zf.writestr("ma_agent/blob.bin", bytes(range(256)) * 1024)
+    encoded = base64.encodebytes(archive.getvalue()).decode()  # line-wrapped
+
+    [ack] = session.handle_message(
+        Message(type=MessageType.UPDATE, payload={"name": "pkg.zip", "content_b64": encoded})
+    )
+    done = notifications.get(timeout=5.0)
+
+    assert ack.type is MessageType.ACK
+    assert ack.payload == {"action": "UPDATE", "status": "accepted"}
+    assert done.type is MessageType.INFO
+    assert (tmp_path / "updates" / "pkg.zip").read_bytes() == archive.getvalue()
+    assert (tmp_path / "root" / "VERSION.txt").read_text() == "9.9.9\n"
+    assert len(launched) == 1
+
+
+def test_update_rejects_invalid_base64(tmp_path, monkeypatch):
+    session, launched, notifications = _update_session(tmp_path, monkeypatch)
+
+    [ack] = session.handle_message(
+        Message(type=MessageType.UPDATE, payload={"name": "pkg.zip", "content_b64": "abcde"})
+    )
+    error = notifications.get(timeout=5.0)
+
+    assert ack.payload["status"] == "accepted"
+    assert error.type is MessageType.ERROR
+    assert error.payload["code"] == "invalid_payload"
+    assert not (tmp_path / "updates" / "pkg.zip").exists()
+    assert launched == []
+
+
+
+def test_failed_update_keeps_the_previous_package(tmp_path, monkeypatch):
+    session, launched, notifications = _update_session(tmp_path, monkeypatch)
+    updates = tmp_path / "updates"
+    updates.mkdir()
+    (updates / "pkg.zip").write_bytes(b"previous package")
+
+    for content_b64 in ("abcde", base64.b64encode(b"not a zip archive").decode()):
+        session.handle_message(
+            Message(type=MessageType.UPDATE, payload={"name": "pkg.zip", "content_b64": content_b64})
+        )
+        assert notifications.get(timeout=5.0).type is MessageType.ERROR
+
+    assert (updates / "pkg.zip").read_bytes() == b"previous package"
+    assert [path.name for path in updates.iterdir()] == ["pkg.zip"]
+    assert launched == []
+
+def test_update_decoding_skips_characters_outside_the_alphabet(monkeypatch):
+    import io
+
+    from ma_agent import session as session_module
+
+    # Tiny slices so stray characters land on both sides of slice boundaries.
+    monkeypatch.setattr(session_module, "_UPDATE_DECODE_CHUNK", 8)
+    clean = base64.b64encode(bytes(range(256))).decode()
+    noisy = "-".join(clean[i:i + 5] for i in range(0, len(clean), 5)).replace("A", "A*")
+    handle = io.BytesIO()
+
+    session_module._write_base64(noisy, handle)
+
+    assert handle.getvalue() == base64.b64decode(noisy) == bytes(range(256))
+
+
+def test_update_reports_invalid_zip(tmp_path, monkeypatch):
+    session, launched, notifications = _update_session(tmp_path, monkeypatch)
+    encoded = base64.b64encode(b"not a zip archive").decode()
+
+    session.handle_message(
+        Message(type=MessageType.UPDATE, payload={"name": "pkg.zip", "content_b64": encoded})
+    )
+    error = notifications.get(timeout=5.0)
+
+    assert error.type is MessageType.ERROR
+    assert error.payload["code"] == "invalid_package"
+    assert launched == []
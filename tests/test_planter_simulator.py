@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import math
+import threading
 import time
 
 import pytest
@@ -33,15 +34,11 @@ def test_planter_simulator_generates_rows_and_headland():
     hello = Message(type=MessageType.HELLO, payload={})
     session.handle_message(hello)
 
-    # Wait for the simulator worker to finish emitting the cycle.
+    # Wait for the simulator to finish emitting the cycle to this session.
     deadline = time.time() + 5.0
-    while True:
-        with simulator._lock:  # type: ignore[attr-defined]
-            worker = simulator._workers.get(session)  # type: ignore[attr-defined]
-        if worker is None or not worker.is_alive():
-            break
+    while session in simulator._streams:  # type: ignore[attr-defined]
         if time.time() > deadline:
-            raise AssertionError("planter simulator worker did not finish in time")
+            raise AssertionError("planter simulator did not finish the cycle in time")
         time.sleep(0.05)
 
     session.close()
@@ -301,4 +298,186 @@ def test_planter_simulator_resolves_agent_root_routes(tmp_path, monkeypatch):
     )
 
     samples = simulator._cycle_samples()
-    assert samples, "should load samples from AGENT_ROOT-configured routes"
\ No newline at end of file
+    assert samples, "should load samples from AGENT_ROOT-configured routes"
+
+
+def test_planter_simulator_builds_the_cycle_once():
+    simulator = PlanterSimulator(
+        field_length_m=20.0,
+        headland_length_m=2.0,
+        speed_mps=5.0,
+        sample_rate_hz=5.0,
+        passes_per_cycle=2,
+        loop_forever=False,
+    )
+
+    first = simulator._shared_cycle()
+
+    assert len(first) > 0
+    assert simulator._shared_cycle() is first
+    with pytest.raises(TypeError):
+        first.east[0] = 1.0
+
+
+def test_planter_simulator_precomputes_articulation_with_the_cycle():
+    simulator = PlanterSimulator(
+        implement_profile=load_implement_profile(),
+        field_length_m=20.0,
+        headland_length_m=2.0,
+        passes_per_cycle=2,
+        loop_forever=False,
+    )
+
+    cycle = simulator._shared_cycle()
+    articulation = cycle.articulation
+
+    assert articulation is not None
+    assert len(articulation.joint_x) == len(cycle)
+    with pytest.raises(TypeError):
+        articulation.theta[0] = 1.0
+
+
+def test_planter_simulator_finds_routes_added_after_indexing(tmp_path):
+    from ma_agent.simulators.planter import _find_route_file
+
+    route_dir = tmp_path / "config" / "routes"
+    route_dir.mkdir(parents=True)
+    with pytest.raises(FileNotFoundError):
+        _find_route_file("late_route.geojson", tmp_path, tmp_path / "cwd")
+
+    route_path = route_dir / "late_route.geojson"
+    route_path.write_text("{}")
+
+    assert _find_route_file("late_route.geojson", tmp_path, tmp_path / "cwd") == route_path
+
+
+def test_planter_simulator_cancels_sessions_waiting_to_stream():
+    class _IdleSession:
+        def can_stream(self):
+            return False
+
+    simulator = PlanterSimulator(loop_forever=False)
+    session = _IdleSession()
+    simulator.register_session(session)
+    stream = simulator._streams[session]  # type: ignore[attr-defined]
+
+    simulator.unregister_session(session)
+    simulator.stop()
+
+    assert stream.cancelled
+    assert session not in simulator._streams  # type: ignore[attr-defined]
+
+
+class _RecordingSession:
+    """Streaming session stand-in that records the fixes it accepts."""
+
+    def __init__(self, accept=lambda: True):
+        self.accept = accept
+        self.messages = []
+        self.threads = set()
+
+    def can_stream(self):
+        return True
+
+    def send_message(self, message):
+        if not self.accept():
+            return False  # transport queue backed up; the fix is dropped
+        self.messages.append(message)
+        self.threads.add(threading.current_thread().name)
+        return True
+
+    @property
+    def sequences(self):
+        return [message.payload["sequence"] for message in self.messages]
+
+    @property
+    def timestamps(self):
+        return [message.payload["timestamp"] for message in self.messages]
+
+
+def _fast_simulator():
+    # A short field crossed quickly, so a whole cycle streams in well under a second.
+    return PlanterSimulator(
+        field_length_m=20.0,
+        headland_length_m=2.0,
+        speed_mps=500.0,
+        sample_rate_hz=5.0,
+        passes_per_cycle=2,
+        loop_forever=False,
+    )
+
+
+def _stream_one_cycle(simulator, sessions):
+    for session in sessions:
+        simulator.register_session(session)
+    deadline = time.time() + 5.0
+    while simulator._streams:  # type: ignore[attr-defined]
+        if time.time() > deadline:
+            raise AssertionError("planter simulator did not finish the cycle in time")
+        time.sleep(0.05)
+    simulator.stop()
+
+
+def test_planter_simulator_cancels_sessions_while_the_cycle_builds(monkeypatch):
+    simulator = PlanterSimulator(loop_forever=False)
+    building = threading.Event()
+    build_cycle = simulator._cycle_samples
+
+    def _slow_cycle_samples():
+        building.set()
+        time.sleep(0.5)
+        return build_cycle()
+
+    monkeypatch.setattr(simulator, "_cycle_samples", _slow_cycle_samples)
+    session = _RecordingSession()
+    simulator.register_session(session)
+    assert building.wait(timeout=5.0)
+
+    started = time.monotonic()
+    simulator.unregister_session(session)
+    elapsed = time.monotonic() - started
+    simulator.stop()
+
+    assert elapsed < 0.25
+
+
+def test_planter_simulator_streams_every_session_from_one_thread():
+    simulator = _fast_simulator()
+    sessions = [_RecordingSession() for _ in range(3)]
+
+    _stream_one_cycle(simulator, sessions)
+
+    expected = list(range(1, len(simulator._shared_cycle()) + 1))
+    for session in sessions:
+        assert session.sequences == expected
+        assert session.threads == {"planter-sim"}
+
+
+def test_planter_simulator_drops_fixes_for_backed_up_sessions():
+    simulator = _fast_simulator()
+    stalled = _RecordingSession(lambda: False)
+    flaky = _RecordingSession(iter([True, False] * 1000).__next__)
+    healthy = _RecordingSession()
+
+    _stream_one_cycle(simulator, [stalled, flaky, healthy])
+
+    count = len(simulator._shared_cycle())
+    assert stalled.sequences == []
+    assert healthy.sequences == list(range(1, count + 1))
+    # Dropped fixes do not consume a sequence number.
+    assert flaky.sequences == list(range(1, len(flaky.sequences) + 1))
+    assert len(flaky.sequences) == (count + 1) // 2
+
+
+def test_planter_simulator_stamps_fixes_with_their_schedule():
+    simulator = _fast_simulator()
+    session = _RecordingSession()
+    started = time.time()
+
+    _stream_one_cycle(simulator, [session])
+
+    time_deltas = list(simulator._shared_cycle().time_delta_s)
+    stamps = session.timestamps
+    intervals = [later - earlier for earlier, later in zip(stamps, stamps[1:])]
+    assert stamps[0] == pytest.approx(started, abs=0.5)
+    assert intervals == pytest.approx(time_deltas[:-1], abs=1e-6)
@@ -0,0 +1,232 @@
+import errno
+import json
+import socket
+
+import pytest
+
+from ma_agent.protocol.codec import LineCodec
+from ma_agent.protocol.messages import Message, MessageType
+from ma_agent.session import GatewaySession
+from ma_agent.transport.base import SEND_BACKLOG_MAX_BYTES, StreamConnection, StreamReactor
+
+
+def _read_lines(sock: socket.socket, count: int) -> list:
+    sock.settimeout(5.0)
+    buffer = b""
+    while buffer.count(b"\n") < count:
+        chunk = sock.recv(4096)
+        if not chunk:
+            break
+        buffer += chunk
+    return [json.loads(line) for line in buffer.split(b"\n") if line]
+
+
+@pytest.fixture
+def reactor():
+    reactor = StreamReactor(name="test-reactor")
+    reactor.start()
+    yield reactor
+    reactor.stop()
+
+
+def _connect(reactor, session_factory=GatewaySession) -> socket.socket:
+    server_sock, client_sock = socket.socketpair()
+    server_sock.setblocking(False)
+    reactor.add_connection(server_sock, "test", session_factory)
+    return client_sock
+
+
+def test_reactor_handles_pipelined_and_split_lines(reactor):
+    client_sock = _connect(reactor)
+    try:
+        client_sock.sendall(b'{"type":"HELLO","payload":{}}\n{"type":"PI')
+        client_sock.sendall(b'NG"}\n\n{"type":"GET_STATUS"}\n')
+
+        hello_ack, pong, status = _read_lines(client_sock, 3)
+    finally:
+        client_sock.close()
+
+    assert hello_ack["type"] == "HELLO_ACK"
+    assert pong["type"] == "PONG"
+    assert status["type"] == "STATUS"
+
+
+def test_reactor_reports_invalid_json(reactor):
+    client_sock = _connect(reactor)
+    try:
+        client_sock.sendall(b"not-json\n")
+        [error] = _read_lines(client_sock, 1)
+    finally:
+        client_sock.close()
+
+    assert error["type"] == "ERROR"
+    assert error["payload"]["code"] == "bad_json"
+
+
+def test_reactor_serves_several_connections(reactor):
+    clients = [_connect(reactor) for _ in range(3)]
+    try:
+        for client in clients:
+            client.sendall(b'{"type":"HELLO","payload":{}}\n')
+        replies = [_read_lines(client, 1)[0]["type"] for client in clients]
+    finally:
+        for client in clients:
+            client.close()
+
+    assert replies == ["HELLO_ACK"] * 3
+
+
+def test_reactor_closes_session_when_peer_disconnects(reactor):
+    import threading
+
+    closed = threading.Event()
+
+    class _Session(GatewaySession):
+        def close(self):
+            super().close()
+            closed.set()
+
+    client_sock = _connect(reactor, _Session)
+    client_sock.sendall(b'{"type":"PING"}\n')
+    _read_lines(client_sock, 1)
+    client_sock.close()
+
+    assert closed.wait(5.0)
+
+
+def test_flush_keeps_the_tail_the_socket_did_not_take():
+    class _Conn:
+        def __init__(self):
+            self.data = b""
+            self.budget = 11
+
+        def fileno(self):
+            return -1
+
+        def sendmsg(self, buffers):
+            if not self.budget:
+                raise BlockingIOError(errno.EAGAIN, "would block")
+            # Accept at most five bytes per call to exercise partial writes.
+            joined = b"".join(bytes(buffer) for buffer in buffers)[: min(5, self.budget)]
+            self.budget -= len(joined)
+            self.data += joined
+            return len(joined)
+
+        def send(self, data):
+            return self.sendmsg([data])
+
+    conn = _Conn()
+    connection = StreamConnection(
+        conn=conn, peer="test", session_factory=GatewaySession, schedule_flush=lambda c: None
+    )
+    for line in (b"abc\n", b"defghij\n", b"k\n"):
+        connection._pending.append(line)
+        connection._backlog += len(line)
+
+    assert connection.flush() is False
+    assert conn.data == b"abc\ndefghij"
+    assert connection.backlog == 3
+
+    conn.budget = 100
+    assert connection.flush() is True
+    assert conn.data == b"abc\ndefghij\nk\n"
+    assert connection.backlog == 0
+
+
+def test_pushes_are_queued_for_one_flush():
+    class _Conn:
+        def __init__(self):
+            self.writes = []
+
+        def fileno(self):
+            return -1
+
+        def sendmsg(self, buffers):
+            self.writes.append(b"".join(bytes(buffer) for buffer in buffers))
+            return len(self.writes[-1])
+
+        def send(self, data):
+            return self.sendmsg([data])
+
+    scheduled = []
+    conn = _Conn()
+    connection = StreamConnection(
+        conn=conn, peer="test", session_factory=GatewaySession, schedule_flush=scheduled.append
+    )
+
+    assert connection._send(Message(MessageType.PONG)) is True
+    assert connection._send(Message(MessageType.PONG)) is True
+
+    # Nothing is written from the sending thread and only one flush is asked for.
+    assert conn.writes == []
+    assert scheduled == [connection]
+    assert connection.flush() is True
+    assert conn.writes == [LineCodec.encode(Message(MessageType.PONG)) * 2]
+
+
+def test_pushes_are_dropped_while_the_peer_is_not_reading():
+    connection = StreamConnection(
+        conn=socket.socket(), peer="test", session_factory=GatewaySession,
+        schedule_flush=lambda c: None,
+    )
+    try:
+        connection._backlog = SEND_BACKLOG_MAX_BYTES
+
+        assert connection._send(Message(MessageType.PONG)) is False
+        assert connection._pending == []
+    finally:
+        connection.conn.close()
+
+
+def test_stalled_peer_does_not_hold_up_other_streams(reactor):
+    stalled_sessions = []
+
+    def _stalled_factory():
+        session = GatewaySession()
+        stalled_sessions.append(session)
+        return session
+
+    stalled = _connect(reactor, _stalled_factory)
+    other = _connect(reactor)
+    try:
+        stalled.sendall(b'{"type":"HELLO","payload":{"subscribe":true}}\n')
+        _read_lines(stalled, 1)
+        [session] = stalled_sessions
+        payload = {"blob": "x" * 4096}
+        # Fill both socket buffers and the backlog; the peer never reads.
+        while session.send_message(Message(MessageType.GNSS_FIX, payload)):
+            pass
+
+        other.sendall(b'{"type":"HELLO","payload":{}}\n')
+        [reply] = _read_lines(other, 1)
+    finally:
+        stalled.close()
+        other.close()
+
+    assert reply["type"] == "HELLO_ACK"
+
+
+def test_update_outcome_follows_its_ack(reactor, tmp_path, monkeypatch):
+    from ma_agent import session as session_module
+
+    class _InlineExecutor:
+        # Worst case for ordering: the outcome is pushed before the handler
+        # has even returned its ACK.
+        def submit(self, fn, *args):
+            fn(*args)
+
+    monkeypatch.setattr(session_module, "UPDATES_DIR", tmp_path / "updates")
+    monkeypatch.setattr(session_module, "_UPDATE_EXECUTOR", _InlineExecutor())
+    client_sock = _connect(reactor)
+    try:
+        client_sock.sendall(
+            b'{"type":"HELLO","payload":{}}\n'
+            b'{"type":"UPDATE","payload":{"name":"pkg.zip","content_b64":"abcde"}}\n'
+            b'{"type":"PING"}\n'
+        )
+        replies = _read_lines(client_sock, 4)
+    finally:
+        client_sock.close()
+
+    assert [reply["type"] for reply in replies] == ["HELLO_ACK", "ACK", "PONG", "ERROR"]
+    assert replies[3]["payload"]["code"] == "invalid_payload"